@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Optional, Sequence, cast
 
-from sqlalchemy import select
+from sqlalchemy import Select, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.domains.audit.models import AuditLog
@@ -17,6 +17,11 @@ class AuditRepository:
         await self.session.flush()
         return log
 
+    async def create_batch(self, logs: list[AuditLog]) -> list[AuditLog]:
+        self.session.add_all(logs)
+        await self.session.flush()
+        return logs
+
     async def query(
         self,
         entity_type: Optional[str] = None,
@@ -26,7 +31,25 @@ class AuditRepository:
         to_timestamp: Optional[datetime] = None,
         skip: int = 0,
         limit: int = 100,
+        after: Optional[tuple[datetime, uuid.UUID]] = None,
     ) -> Sequence[AuditLog]:
+        stmt = self._query_statement(
+            entity_type, entity_id, action, from_timestamp, to_timestamp, skip, limit, after
+        )
+        result = await self.session.execute(stmt)
+        return cast(Sequence[AuditLog], result.scalars().all())
+
+    def _query_statement(
+        self,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[uuid.UUID] = None,
+        action: Optional[str] = None,
+        from_timestamp: Optional[datetime] = None,
+        to_timestamp: Optional[datetime] = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[tuple[datetime, uuid.UUID]] = None,
+    ) -> Select:
         stmt = select(AuditLog)
         if entity_type:
             stmt = stmt.where(AuditLog.entity_type == entity_type)
@@ -38,6 +61,10 @@ class AuditRepository:
             stmt = stmt.where(AuditLog.timestamp >= from_timestamp)
         if to_timestamp:
             stmt = stmt.where(AuditLog.timestamp <= to_timestamp)
-        stmt = stmt.offset(skip).limit(limit).order_by(AuditLog.timestamp.desc())
-        result = await self.session.execute(stmt)
-        return cast(Sequence[AuditLog], result.scalars().all())
+        # Keyset cursor: the (timestamp, id) of the last log on the previous page.
+        # Seeks on the index instead of scanning past skipped rows like OFFSET.
+        if after:
+            stmt = stmt.where(tuple_(AuditLog.timestamp, AuditLog.id) < tuple_(*after))
+        return (
+            stmt.offset(skip).limit(limit).order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
+        )
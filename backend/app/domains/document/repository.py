@@ -1,7 +1,7 @@
 import uuid
 from typing import Optional, Sequence, cast
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.domains.document.models import Document, DocumentVersion
@@ -32,6 +32,11 @@ class DocumentRepository:
         await self.session.flush()
         return version
 
+    async def create_version_batch(self, versions: list[DocumentVersion]) -> list[DocumentVersion]:
+        self.session.add_all(versions)
+        await self.session.flush()
+        return versions
+
     async def get_version(
         self, document_id: uuid.UUID, version_number: int
     ) -> Optional[DocumentVersion]:
@@ -53,10 +58,12 @@ class DocumentRepository:
         return cast(Optional[DocumentVersion], result.scalar_one_or_none())
 
     async def list_versions(self, document_id: uuid.UUID) -> Sequence[DocumentVersion]:
-        stmt = (
+        result = await self.session.execute(self._list_versions_statement(document_id))
+        return cast(Sequence[DocumentVersion], result.scalars().all())
+
+    def _list_versions_statement(self, document_id: uuid.UUID) -> Select:
+        return (
             select(DocumentVersion)
             .where(DocumentVersion.document_id == document_id)
             .order_by(DocumentVersion.version_number.desc())
         )
-        result = await self.session.execute(stmt)
-        return cast(Sequence[DocumentVersion], result.scalars().all())
@@ -75,6 +75,7 @@ class Job(Base):
     __table_args__ = (
         Index("ix_jobs_status", "status"),
         Index("ix_jobs_status_created", "status", "created_at"),
+        Index("ix_jobs_type_created", "job_type", "created_at"),
         Index("ix_jobs_payload_entity", "payload", postgresql_using="gin"),
     )
 
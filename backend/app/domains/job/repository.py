@@ -2,13 +2,19 @@ import uuid
 from datetime import timedelta
 from typing import Optional, Sequence, cast
 
-from sqlalchemy import and_, select
+from sqlalchemy import ColumnElement, Select, String, Update, and_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.domains.job.models import Job, JobStatus, JobType
 from backend.app.infrastructure.datetime_utils import utc_now
 
 
+def _payload_text(key: str) -> ColumnElement[str]:
+    # payload ->> key, the form a PostgreSQL expression index on the payload key
+    # matches (as_string() would wrap it in a CAST); SQLite supports ->> natively
+    return Job.payload.op("->>", return_type=String)(key)
+
+
 class JobRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -18,6 +24,11 @@ class JobRepository:
         await self.session.flush()
         return job
 
+    async def create_batch(self, jobs: list[Job]) -> list[Job]:
+        self.session.add_all(jobs)
+        await self.session.flush()
+        return jobs
+
     async def get_by_id(self, job_id: uuid.UUID) -> Optional[Job]:
         stmt = select(Job).where(Job.id == job_id)
         result = await self.session.execute(stmt)
@@ -30,14 +41,24 @@ class JobRepository:
         skip: int = 0,
         limit: int = 100,
     ) -> Sequence[Job]:
+        result = await self.session.execute(
+            self._list_all_statement(status_filter, job_type, skip, limit)
+        )
+        return cast(Sequence[Job], result.scalars().all())
+
+    def _list_all_statement(
+        self,
+        status_filter: Optional[JobStatus] = None,
+        job_type: Optional[JobType] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Select:
         stmt = select(Job)
         if status_filter:
             stmt = stmt.where(Job.status == status_filter)
         if job_type:
             stmt = stmt.where(Job.job_type == job_type)
-        stmt = stmt.offset(skip).limit(limit).order_by(Job.created_at.desc())
-        result = await self.session.execute(stmt)
-        return cast(Sequence[Job], result.scalars().all())
+        return stmt.offset(skip).limit(limit).order_by(Job.created_at.desc())
 
     async def list_by_entity(
         self,
@@ -49,7 +70,7 @@ class JobRepository:
         key = f"{entity_type}_id"
         stmt = (
             select(Job)
-            .where(Job.payload[key].astext == str(entity_id))
+            .where(_payload_text(key) == str(entity_id))
             .offset(skip)
             .limit(limit)
             .order_by(Job.created_at.desc())
@@ -57,30 +78,42 @@ class JobRepository:
         result = await self.session.execute(stmt)
         return cast(Sequence[Job], result.scalars().all())
 
-    async def claim_pending_job(
-        self, worker_id: str, job_types: Optional[list[JobType]] = None
-    ) -> Optional[Job]:
-        stmt = (
-            select(Job)
-            .where(Job.status == JobStatus.PENDING)
-            .order_by(Job.created_at.asc())
-            .limit(1)
-            .with_for_update(skip_locked=True)
-        )
+    def _claim_statement(
+        self, worker_id: str, job_types: Optional[list[JobType]], limit: int
+    ) -> Update:
+        candidates = select(Job.id).where(Job.status == JobStatus.PENDING)
         if job_types:
-            stmt = stmt.where(Job.job_type.in_(job_types))
+            candidates = candidates.where(Job.job_type.in_(job_types))
+        candidates = (
+            candidates.order_by(Job.created_at.asc()).limit(limit).with_for_update(skip_locked=True)
+        )
 
-        result = await self.session.execute(stmt)
-        job = cast(Optional[Job], result.scalar_one_or_none())
+        # Pick and claim the oldest pending jobs in one UPDATE ... RETURNING round-trip;
+        # SKIP LOCKED lets concurrent workers pass over rows another worker is claiming.
+        now = utc_now()
+        return (
+            update(Job)
+            .where(Job.id.in_(candidates))
+            .values(status=JobStatus.RUNNING, worker_id=worker_id, started_at=now, updated_at=now)
+            .returning(Job)
+            .execution_options(populate_existing=True)
+        )
 
-        if job:
-            job.status = JobStatus.RUNNING
-            job.worker_id = worker_id
-            job.started_at = utc_now()
-            job.updated_at = utc_now()
-            await self.session.flush()
+    async def claim_pending_job(
+        self, worker_id: str, job_types: Optional[list[JobType]] = None
+    ) -> Optional[Job]:
+        result = await self.session.execute(self._claim_statement(worker_id, job_types, limit=1))
+        return cast(Optional[Job], result.scalar_one_or_none())
 
-        return job
+    async def claim_pending_jobs_batch(
+        self, worker_id: str, limit: int, job_types: Optional[list[JobType]] = None
+    ) -> list[Job]:
+        # SQLite reads a negative LIMIT as unbounded, which would claim every pending job
+        if limit < 1:
+            raise ValueError(f"limit must be >= 1, got {limit}")
+        result = await self.session.execute(self._claim_statement(worker_id, job_types, limit))
+        # RETURNING carries no ordering guarantee, so restore claim (FIFO) order here
+        return sorted(result.scalars().all(), key=lambda job: job.created_at)
 
     async def complete_job(self, job_id: uuid.UUID, result: Optional[dict] = None) -> Optional[Job]:
         job = await self.get_by_id(job_id)
@@ -106,6 +139,34 @@ class JobRepository:
         await self.session.flush()
         return job
 
+    async def _get_many(self, job_ids: list[uuid.UUID], statuses: list[JobStatus]) -> list[Job]:
+        stmt = select(Job).where(Job.id.in_(job_ids), Job.status.in_(statuses))
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def complete_jobs_batch(self, results: dict[uuid.UUID, Optional[dict]]) -> list[Job]:
+        # One SELECT for the running jobs, then one flush whose UPDATEs go out together
+        jobs = await self._get_many(list(results), [JobStatus.RUNNING])
+        now = utc_now()
+        for job in jobs:
+            job.status = JobStatus.COMPLETED
+            job.result = results[job.id]
+            job.completed_at = now
+            job.updated_at = now
+        await self.session.flush()
+        return jobs
+
+    async def fail_jobs_batch(self, errors: dict[uuid.UUID, str]) -> list[Job]:
+        jobs = await self._get_many(list(errors), [JobStatus.PENDING, JobStatus.RUNNING])
+        now = utc_now()
+        for job in jobs:
+            job.status = JobStatus.FAILED
+            job.error = errors[job.id]
+            job.completed_at = now
+            job.updated_at = now
+        await self.session.flush()
+        return jobs
+
     async def find_stuck_jobs(self, timeout_minutes: int = 30) -> Sequence[Job]:
         threshold = utc_now() - timedelta(minutes=timeout_minutes)
         stmt = select(Job).where(
@@ -135,7 +196,7 @@ class JobRepository:
     ) -> dict[JobType, Optional[Job]]:
         stmt = (
             select(Job)
-            .where(Job.payload["template_version_id"].astext == str(template_version_id))
+            .where(_payload_text("template_version_id") == str(template_version_id))
             .order_by(Job.created_at.desc())
         )
         result = await self.session.execute(stmt)
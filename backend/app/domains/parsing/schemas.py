@@ -47,7 +47,7 @@ class ParagraphBlock(BaseModel):
 
     @property
     def text(self) -> str:
-        return "".join(run.text for run in self.runs)
+        return "".join([run.text for run in self.runs])
 
 
 class HeadingBlock(BaseModel):
@@ -61,7 +61,7 @@ class HeadingBlock(BaseModel):
 
     @property
     def text(self) -> str:
-        return "".join(run.text for run in self.runs)
+        return "".join([run.text for run in self.runs])
 
 
 class TableCell(BaseModel):
@@ -106,7 +106,7 @@ class ListItem(BaseModel):
 
     @property
     def text(self) -> str:
-        return "".join(run.text for run in self.runs)
+        return "".join([run.text for run in self.runs])
 
 
 class ListBlock(BaseModel):
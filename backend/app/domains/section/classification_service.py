@@ -1,3 +1,4 @@
+import asyncio
 import time
 from typing import Any
 from uuid import UUID
@@ -12,7 +13,10 @@ from backend.app.domains.section.classification_schemas import (
 from backend.app.domains.section.llm_classifier import LLMClassifier, LLMClassifierConfig
 from backend.app.domains.section.models import Section, SectionType
 from backend.app.domains.section.repository import SectionRepository
-from backend.app.domains.section.rule_based_classifier import RuleBasedClassifier
+from backend.app.domains.section.rule_based_classifier import (
+    RuleBasedClassifier,
+    get_rule_based_classifier,
+)
 from backend.app.logging_config import get_logger
 
 logger = get_logger("app.domains.section.classification_service")
@@ -24,10 +28,17 @@ class ClassificationService:
         rule_classifier: RuleBasedClassifier,
         llm_classifier: LLMClassifier | None = None,
         confidence_threshold: float = 0.85,
+        max_concurrent_llm_calls: int = 4,
     ):
+        # A zero-permit semaphore would leave every LLM-bound block waiting forever
+        if max_concurrent_llm_calls < 1:
+            raise ValueError(
+                f"max_concurrent_llm_calls must be >= 1, got {max_concurrent_llm_calls}"
+            )
         self.rule_classifier = rule_classifier
         self.llm_classifier = llm_classifier
         self.confidence_threshold = confidence_threshold
+        self.max_concurrent_llm_calls = max_concurrent_llm_calls
 
     async def classify_template_sections(
         self,
@@ -41,22 +52,48 @@ class ClassificationService:
             f"Starting classification for template version {template_version_id}, "
             f"{len(parsed_document.blocks)} blocks"
         )
-        classifications: list[SectionClassificationResult] = []
-        errors: list[str] = []
+        blocks = parsed_document.blocks
+        results: list[SectionClassificationResult | None] = [None] * len(blocks)
+        errors_by_index: dict[int, str] = {}
+        llm_pending: list[tuple[int, DocumentBlock, dict[str, Any]]] = []
 
-        for i, block in enumerate(parsed_document.blocks):
-            try:
-                context = self._build_context(i, parsed_document.blocks)
-                result = self._classify_block(block, context)
-                classifications.append(result)
+        # Each block's type string feeds both neighbours' contexts; compute it once.
+        block_types = [self._block_type(block) for block in blocks]
 
+        # Rule-based classification is CPU-only, so it runs inline; blocks the rules
+        # cannot decide are queued for the LLM and awaited concurrently below.
+        for i, block in enumerate(blocks):
+            try:
+                context = self._build_context(i, blocks, block_types)
+                rule_result = self._classify_by_rules(block, context)
+                if rule_result:
+                    results[i] = rule_result
+                elif self.llm_classifier:
+                    llm_pending.append((i, block, context))
+                else:
+                    results[i] = self._create_fallback_classification(block)
             except Exception as e:
-                block_id = getattr(block, "block_id", f"block_{i}")
-                error_msg = f"Failed to classify block {block_id}: {e}"
-                logger.error(error_msg, exc_info=True)
-                errors.append(error_msg)
-                fallback_result = self._create_fallback_classification(block)
-                classifications.append(fallback_result)
+                errors_by_index[i] = self._record_block_error(i, block, e)
+                results[i] = self._create_fallback_classification(block)
+
+        if llm_pending:
+            semaphore = asyncio.Semaphore(self.max_concurrent_llm_calls)
+            llm_results = await asyncio.gather(
+                *(
+                    self._classify_by_llm_bounded(block, context, semaphore)
+                    for _, block, context in llm_pending
+                ),
+                return_exceptions=True,
+            )
+            for (i, block, _), llm_result in zip(llm_pending, llm_results, strict=True):
+                if isinstance(llm_result, BaseException):
+                    errors_by_index[i] = self._record_block_error(i, block, llm_result)
+                    results[i] = self._create_fallback_classification(block)
+                else:
+                    results[i] = llm_result
+
+        classifications = [result for result in results if result is not None]
+        errors = [errors_by_index[i] for i in sorted(errors_by_index)]
         await self._persist_classifications(
             template_version_id=template_version_id,
             classifications=classifications,
@@ -81,11 +118,25 @@ class ClassificationService:
     def _classify_block(
         self, block: DocumentBlock, context: dict[str, Any]
     ) -> SectionClassificationResult:
+        rule_result = self._classify_by_rules(block, context)
+        if rule_result:
+            return rule_result
+        return self._classify_by_llm(block, context)
+
+    def _classify_by_rules(
+        self, block: DocumentBlock, context: dict[str, Any]
+    ) -> SectionClassificationResult | None:
         block_id = getattr(block, "block_id", "unknown")
         rule_result = self.rule_classifier.classify(block, context)
         if rule_result and rule_result.confidence_score >= self.confidence_threshold:
             logger.debug(f"Block {block_id} classified by rules: {rule_result.section_type}")
             return rule_result
+        return None
+
+    def _classify_by_llm(
+        self, block: DocumentBlock, context: dict[str, Any]
+    ) -> SectionClassificationResult:
+        block_id = getattr(block, "block_id", "unknown")
         if self.llm_classifier:
             llm_result = self.llm_classifier.classify(block, context)
             if llm_result and llm_result.confidence_score >= self.confidence_threshold:
@@ -100,6 +151,20 @@ class ClassificationService:
         logger.debug(f"Block {block_id} using conservative fallback (STATIC)")
         return self._create_fallback_classification(block)
 
+    async def _classify_by_llm_bounded(
+        self, block: DocumentBlock, context: dict[str, Any], semaphore: asyncio.Semaphore
+    ) -> SectionClassificationResult:
+        # The LLM client is synchronous; run each call in a worker thread so up to
+        # max_concurrent_llm_calls requests are in flight at once.
+        async with semaphore:
+            return await asyncio.to_thread(self._classify_by_llm, block, context)
+
+    def _record_block_error(self, index: int, block: DocumentBlock, error: BaseException) -> str:
+        block_id = getattr(block, "block_id", f"block_{index}")
+        error_msg = f"Failed to classify block {block_id}: {error}"
+        logger.error(error_msg, exc_info=error)
+        return error_msg
+
     def _create_fallback_classification(self, block: DocumentBlock) -> SectionClassificationResult:
         block_id = getattr(block, "block_id", "unknown")
 
@@ -113,20 +178,34 @@ class ClassificationService:
             metadata={"fallback_reason": "no_confident_classification"},
         )
 
-    def _build_context(self, index: int, blocks: list[DocumentBlock]) -> dict[str, Any]:
+    def _build_context(
+        self,
+        index: int,
+        blocks: list[DocumentBlock],
+        block_types: list[str] | None = None,
+    ) -> dict[str, Any]:
         context: dict[str, Any] = {
             "position_in_document": index,
             "total_blocks": len(blocks),
         }
         if index > 0:
-            prev_block = blocks[index - 1]
-            context["previous_block_type"] = str(getattr(prev_block, "block_type", "unknown"))
+            context["previous_block_type"] = (
+                block_types[index - 1]
+                if block_types is not None
+                else self._block_type(blocks[index - 1])
+            )
         if index < len(blocks) - 1:
-            next_block = blocks[index + 1]
-            context["next_block_type"] = str(getattr(next_block, "block_type", "unknown"))
+            context["next_block_type"] = (
+                block_types[index + 1]
+                if block_types is not None
+                else self._block_type(blocks[index + 1])
+            )
 
         return context
 
+    def _block_type(self, block: DocumentBlock) -> str:
+        return str(getattr(block, "block_type", "unknown"))
+
     async def _persist_classifications(
         self,
         template_version_id: UUID,
@@ -201,8 +280,9 @@ class ClassificationService:
 def create_classification_service(
     llm_config: LLMClassifierConfig | None = None,
     confidence_threshold: float = 0.85,
+    max_concurrent_llm_calls: int = 4,
 ) -> ClassificationService:
-    rule_classifier = RuleBasedClassifier(confidence_threshold=confidence_threshold)
+    rule_classifier = get_rule_based_classifier(confidence_threshold)
 
     llm_classifier = None
     if llm_config and llm_config.enabled and llm_config.api_key:
@@ -212,4 +292,5 @@ def create_classification_service(
         rule_classifier=rule_classifier,
         llm_classifier=llm_classifier,
         confidence_threshold=confidence_threshold,
+        max_concurrent_llm_calls=max_concurrent_llm_calls,
     )
@@ -0,0 +1,99 @@
+from collections import deque
+from collections.abc import Hashable
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class KeywordTrie:
+    """Case-folded keyword trie with Aho-Corasick failure links.
+
+    Keywords sharing a prefix share a path, and on a mismatch the walk falls
+    back to the longest proper suffix that is still a valid prefix, so a scan
+    is a single pass over the text regardless of how many keywords are loaded.
+    Callers pass text that has already been lowercased.
+    """
+
+    def __init__(self) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._terminal: list[list[int]] = [[]]
+        self._output: list[list[int]] = [[]]
+        self._keywords: list[tuple[int, Hashable, bool, bool, bool]] = []
+        self._built = False
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def add(self, keyword: str, tag: Hashable, trailing_boundary: bool = True) -> None:
+        keyword = keyword.lower()
+        if not keyword:
+            raise ValueError("Keyword must not be empty")
+        node = 0
+        for char in keyword:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._terminal.append([])
+            node = next_node
+        self._terminal[node].append(len(self._keywords))
+        self._keywords.append(
+            (
+                len(keyword),
+                tag,
+                trailing_boundary,
+                _is_word_char(keyword[0]),
+                _is_word_char(keyword[-1]),
+            )
+        )
+        self._built = False
+
+    def build(self) -> None:
+        self._output = [list(terminal) for terminal in self._terminal]
+        queue: deque[int] = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+        self._built = True
+
+    def scan(self, text_lower: str) -> set[Hashable]:
+        """Return the tags of every keyword occurring in the text on word boundaries."""
+        if not self._built:
+            self.build()
+        goto, fail, output, keywords = self._goto, self._fail, self._output, self._keywords
+        text_length = len(text_lower)
+        hits: set[Hashable] = set()
+        node = 0
+        for end, char in enumerate(text_lower):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for keyword_index in output[node]:
+                length, tag, trailing_boundary, first_is_word, last_is_word = keywords[
+                    keyword_index
+                ]
+                if tag in hits:
+                    continue
+                start = end - length + 1
+                before_is_word = start > 0 and _is_word_char(text_lower[start - 1])
+                if before_is_word == first_is_word:
+                    continue
+                if trailing_boundary:
+                    after_is_word = end + 1 < text_length and _is_word_char(text_lower[end + 1])
+                    if after_is_word == last_is_word:
+                        continue
+                hits.add(tag)
+        return hits
@@ -1,4 +1,5 @@
 import json
+import threading
 import time
 from typing import Any
 
@@ -81,10 +82,15 @@ Only output valid JSON. No other text."""
     def __init__(self, config: LLMClassifierConfig):
         self.config = config
         self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
 
     def _get_client(self) -> httpx.Client:
+        # classify runs on worker threads, so creation is locked to stop racing
+        # threads each opening a client and leaking all but the last one
         if self._client is None:
-            self._client = httpx.Client(timeout=self.config.timeout_seconds)
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(timeout=self.config.timeout_seconds)
         return self._client
 
     def classify(
@@ -231,7 +237,7 @@ Classify as STATIC or DYNAMIC with confidence and reasoning."""
         if hasattr(block, "text"):
             return block.text
         if hasattr(block, "runs"):
-            return "".join(run.text for run in block.runs)
+            return "".join([run.text for run in block.runs])
         return ""
 
     def _create_result(
@@ -265,6 +271,7 @@ Classify as STATIC or DYNAMIC with confidence and reasoning."""
         )
 
     def close(self):
-        if self._client:
-            self._client.close()
-            self._client = None
+        with self._client_lock:
+            if self._client:
+                self._client.close()
+                self._client = None
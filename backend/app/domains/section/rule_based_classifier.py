@@ -1,4 +1,5 @@
 import re
+from functools import cache
 from typing import Any
 
 from backend.app.domains.parsing.schemas import (
@@ -12,10 +13,31 @@ from backend.app.domains.section.classification_schemas import (
     ClassificationMethod,
     SectionClassificationResult,
 )
+from backend.app.domains.section.keyword_trie import KeywordTrie
 from backend.app.logging_config import get_logger
 
 logger = get_logger("app.domains.section.rule_based_classifier")
 
+# Matches patterns of the form \b(literal|literal|...) with an optional trailing \b,
+# whose alternatives contain no regex metacharacters and can be served by the trie.
+_LITERAL_ALTERNATION = re.compile(r"^\\b\(([^\\()\[\]{}^$.*+?]+)\)(\\b)?$")
+
+
+def _build_keyword_trie(
+    patterns: list[tuple[re.Pattern[str], float, str]],
+) -> tuple[KeywordTrie, frozenset[re.Pattern[str]]]:
+    trie = KeywordTrie()
+    covered: set[re.Pattern[str]] = set()
+    for pattern, _, _ in patterns:
+        match = _LITERAL_ALTERNATION.match(pattern.pattern)
+        if not match or not pattern.flags & re.IGNORECASE:
+            continue
+        for keyword in match.group(1).split("|"):
+            trie.add(keyword, pattern, trailing_boundary=match.group(2) is not None)
+        covered.add(pattern)
+    trie.build()
+    return trie, frozenset(covered)
+
 
 class RuleBasedClassifier:
     STATIC_PATTERNS = [
@@ -62,9 +84,10 @@ class RuleBasedClassifier:
             "Document section heading (static structure)",
         ),
     ]
+    PLACEHOLDER_PATTERN = re.compile(r"\{[^}]+\}|\[[^\]]+\]|<[^>]+>|\$\{[^}]+\}")
     DYNAMIC_PATTERNS = [
         (
-            re.compile(r"\{[^}]+\}|\[[^\]]+\]|<[^>]+>|\$\{[^}]+\}"),
+            PLACEHOLDER_PATTERN,
             0.95,
             "Contains placeholder syntax",
         ),
@@ -103,6 +126,21 @@ class RuleBasedClassifier:
         "table_cell": 0.80,  # Tables often contain dynamic data
     }
 
+    # Confidences _apply_heuristics assigns to each content heuristic
+    SHORT_TEXT_CONFIDENCE = 0.75
+    ALL_CAPS_CONFIDENCE = 0.80
+    LONG_NARRATIVE_CONFIDENCE = 0.72
+    MAX_HEURISTIC_CONFIDENCE = max(
+        SHORT_TEXT_CONFIDENCE, ALL_CAPS_CONFIDENCE, LONG_NARRATIVE_CONFIDENCE
+    )
+
+    # Word-bounded keyword alternations are matched in a single trie walk per block;
+    # anchored and placeholder patterns still go through their compiled regex.
+    KEYWORD_TRIE, TRIE_PATTERNS = _build_keyword_trie(STATIC_PATTERNS + DYNAMIC_PATTERNS)
+    # Regexes that cannot match unless the block contains one of these characters;
+    # checked against the block's character set before the regex is run.
+    REQUIRED_CHARACTERS = {PLACEHOLDER_PATTERN: frozenset("{[<")}
+
     def __init__(self, confidence_threshold: float = 0.85):
         self.confidence_threshold = confidence_threshold
 
@@ -111,8 +149,33 @@ class RuleBasedClassifier:
     ) -> SectionClassificationResult | None:
         block_id = getattr(block, "block_id", "unknown")
         text = self._extract_text(block)
+        # Every pattern needs at least one non-space character, so blank blocks
+        # (headers, footers, breaks, empty paragraphs) skip straight to the
+        # structural checks without folding or scanning any text.
+        if text and not text.isspace():
+            pattern_result = self._match_patterns(block_id, text)
+            if pattern_result:
+                return pattern_result
+        structural_result = self._check_structural_indicators(block, context)
+        if structural_result and structural_result.confidence_score >= self.confidence_threshold:
+            return structural_result
+        # Heuristic results never exceed MAX_HEURISTIC_CONFIDENCE, so above that
+        # threshold the pass can never produce an accepted result and is skipped.
+        if self.confidence_threshold <= self.MAX_HEURISTIC_CONFIDENCE:
+            heuristic_result = self._apply_heuristics(block, text, context)
+            if heuristic_result and heuristic_result.confidence_score >= self.confidence_threshold:
+                return heuristic_result
+        logger.debug(f"No confident rule-based classification for block {block_id}")
+        return None
+
+    def _match_patterns(self, block_id: str, text: str) -> SectionClassificationResult | None:
+        # Case-fold once per block; every pattern is case-insensitive, so both the
+        # trie walk and the remaining regexes run against the same lowered text.
+        text_lower = text.lower()
+        keyword_hits = self.KEYWORD_TRIE.scan(text_lower)
+        characters = set(text_lower)
         for pattern, confidence, reason in self.STATIC_PATTERNS:
-            if pattern.search(text):
+            if self._pattern_matches(pattern, text_lower, characters, keyword_hits):
                 return self._create_result(
                     block_id=block_id,
                     section_type="STATIC",
@@ -121,7 +184,7 @@ class RuleBasedClassifier:
                     metadata={"pattern": pattern.pattern, "text_sample": text[:100]},
                 )
         for pattern, confidence, reason in self.DYNAMIC_PATTERNS:
-            if pattern.search(text):
+            if self._pattern_matches(pattern, text_lower, characters, keyword_hits):
                 return self._create_result(
                     block_id=block_id,
                     section_type="DYNAMIC",
@@ -129,15 +192,22 @@ class RuleBasedClassifier:
                     justification=f"Rule-based: {reason}",
                     metadata={"pattern": pattern.pattern, "text_sample": text[:100]},
                 )
-        structural_result = self._check_structural_indicators(block, context)
-        if structural_result and structural_result.confidence_score >= self.confidence_threshold:
-            return structural_result
-        heuristic_result = self._apply_heuristics(block, text, context)
-        if heuristic_result and heuristic_result.confidence_score >= self.confidence_threshold:
-            return heuristic_result
-        logger.debug(f"No confident rule-based classification for block {block_id}")
         return None
 
+    def _pattern_matches(
+        self,
+        pattern: re.Pattern[str],
+        text_lower: str,
+        characters: set[str],
+        keyword_hits: set[Any],
+    ) -> bool:
+        if pattern in self.TRIE_PATTERNS:
+            return pattern in keyword_hits
+        required = self.REQUIRED_CHARACTERS.get(pattern)
+        if required is not None and required.isdisjoint(characters):
+            return False
+        return pattern.search(text_lower) is not None
+
     def _check_structural_indicators(
         self, block: DocumentBlock, context: dict[str, Any]
     ) -> SectionClassificationResult | None:
@@ -171,7 +241,7 @@ class RuleBasedClassifier:
             return self._create_result(
                 block_id=block_id,
                 section_type="STATIC",
-                confidence=0.75,
+                confidence=self.SHORT_TEXT_CONFIDENCE,
                 justification="Very short content, likely structural label",
                 metadata={"text_length": len(text)},
             )
@@ -179,7 +249,7 @@ class RuleBasedClassifier:
             return self._create_result(
                 block_id=block_id,
                 section_type="STATIC",
-                confidence=0.80,
+                confidence=self.ALL_CAPS_CONFIDENCE,
                 justification="ALL CAPS short text, likely static header",
                 metadata={"text_sample": text},
             )
@@ -189,7 +259,7 @@ class RuleBasedClassifier:
                 return self._create_result(
                     block_id=block_id,
                     section_type="DYNAMIC",
-                    confidence=0.72,
+                    confidence=self.LONG_NARRATIVE_CONFIDENCE,
                     justification="Long narrative paragraph, likely client-specific content",
                     metadata={"word_count": word_count},
                 )
@@ -200,7 +270,7 @@ class RuleBasedClassifier:
         if hasattr(block, "text"):
             return block.text
         if hasattr(block, "runs"):
-            return "".join(run.text for run in block.runs)
+            return "".join([run.text for run in block.runs])
         return ""
 
     def _create_result(
@@ -227,3 +297,10 @@ class RuleBasedClassifier:
             justification=justification,
             metadata=metadata,
         )
+
+
+@cache
+def get_rule_based_classifier(confidence_threshold: float = 0.85) -> RuleBasedClassifier:
+    # Compiled patterns and the keyword trie live on the class, so an instance only
+    # carries its threshold and can be shared by every service built with it.
+    return RuleBasedClassifier(confidence_threshold=confidence_threshold)
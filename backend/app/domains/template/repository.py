@@ -37,6 +37,16 @@ class TemplateRepository:
         await self.session.flush()
         return version
 
+    async def create_with_versions(
+        self, template: Template, versions: Sequence[TemplateVersion]
+    ) -> Template:
+        # Linking through the relationship lets one flush insert the template
+        # and then every version in a single multi-row INSERT.
+        template.versions.extend(versions)
+        self.session.add(template)
+        await self.session.flush()
+        return template
+
     async def get_version(
         self, template_id: uuid.UUID, version_number: int
     ) -> TemplateVersion | None:
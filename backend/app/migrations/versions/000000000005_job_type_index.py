@@ -0,0 +1,16 @@
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "000000000005"
+down_revision: Union[str, None] = "000000000004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_jobs_type_created", "jobs", ["job_type", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_type_created", table_name="jobs")
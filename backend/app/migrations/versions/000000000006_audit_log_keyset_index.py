@@ -0,0 +1,16 @@
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "000000000006"
+down_revision: Union[str, None] = "000000000005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_audit_logs_timestamp_id", "audit_logs", ["timestamp", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_logs_timestamp_id", table_name="audit_logs")
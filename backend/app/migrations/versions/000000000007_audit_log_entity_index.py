@@ -0,0 +1,18 @@
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "000000000007"
+down_revision: Union[str, None] = "000000000006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_audit_logs_entity", "audit_logs", ["entity_type", "entity_id", "timestamp", "id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_logs_entity", table_name="audit_logs")
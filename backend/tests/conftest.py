@@ -9,20 +9,30 @@ This module provides:
 """
 
 import asyncio
+import itertools
 import os
 import sys
-from collections.abc import AsyncGenerator, Generator
-from uuid import uuid4
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
+from uuid import UUID, uuid4
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import JSON
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import JSON, event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
 
 # Add the workspace root to the Python path for absolute imports
 workspace_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, workspace_root)
 
+# The database every test session runs against (see ``async_engine``)
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
 # Set test environment variables BEFORE importing app modules
 os.environ.setdefault("APP_ENV", "test")
 os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
@@ -41,6 +51,7 @@ postgresql.JSONB = JSON
 
 from backend.app.config import Settings  # noqa: E402
 from backend.app.domains.assembly.models import AssembledDocument  # noqa: E402, F401
+from backend.app.domains.audit.models import AuditLog  # noqa: E402, F401
 from backend.app.domains.document.models import Document  # noqa: E402
 from backend.app.domains.generation.models import (  # noqa: E402, F401
     GenerationInput,
@@ -50,8 +61,12 @@ from backend.app.domains.generation.section_output_models import (  # noqa: E402
     SectionOutput,
     SectionOutputBatch,
 )
+from backend.app.domains.job.models import Job  # noqa: E402, F401
 from backend.app.domains.rendering.models import RenderedDocument  # noqa: E402, F401
-from backend.app.infrastructure.database import Base  # noqa: E402
+from backend.app.domains.section.models import Section  # noqa: E402, F401
+from backend.app.domains.template.models import Template, TemplateVersion  # noqa: E402
+from backend.app.infrastructure.database import Base, json_serializer  # noqa: E402
+from tests.helpers.storage import MockStorageService  # noqa: E402
 
 # ============================================================================
 # Event Loop Configuration
@@ -60,8 +75,17 @@ from backend.app.infrastructure.database import Base  # noqa: E402
 
 @pytest.fixture(scope="session")
 def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create a session-scoped event loop for async tests."""
-    loop = asyncio.new_event_loop()
+    """Create a session-scoped event loop for async tests.
+
+    Uses uvloop when it is installed (it ships with uvicorn[standard] on
+    POSIX), falling back to the default asyncio loop elsewhere.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    else:
+        loop = uvloop.new_event_loop()
     yield loop
     loop.close()
 
@@ -91,136 +115,123 @@ def test_settings() -> Settings:
 # ============================================================================
 
 
-@pytest_asyncio.fixture
-async def async_engine():
-    """Create async SQLite engine for testing."""
+def _enable_sqlite_savepoints(engine: AsyncEngine) -> None:
+    # The sqlite driver defers BEGIN on its own, which breaks SAVEPOINTs;
+    # let SQLAlchemy emit BEGIN itself so nested transactions behave.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+def _keep_sqlite_temp_in_memory(engine: AsyncEngine) -> None:
+    # An in-memory database already journals in memory, but the temporary
+    # b-trees SQLite builds for sorts and subqueries default to temp files.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_temp_store(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
+async def _create_schema(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+@pytest.fixture(scope="session")
+def async_engine(
+    event_loop: asyncio.AbstractEventLoop,
+) -> Generator[AsyncEngine, None, None]:
+    """Create the async SQLite engine and its schema once per test session.
+
+    Driven on the session event loop directly, since pytest-asyncio only runs
+    async fixtures at function scope reliably in this setup.
+    """
+    # One pooled connection holds the in-memory database for the whole session;
+    # any other pool would hand out fresh, empty databases.
     engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
+        TEST_DATABASE_URL,
         echo=False,
         future=True,
+        poolclass=StaticPool,
+        json_serializer=json_serializer,
     )
-
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    _enable_sqlite_savepoints(engine)
+    _keep_sqlite_temp_in_memory(engine)
+    event_loop.run_until_complete(_create_schema(engine))
 
     yield engine
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-
-    await engine.dispose()
+    event_loop.run_until_complete(engine.dispose())
 
 
 @pytest_asyncio.fixture
 async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a database session with automatic rollback after each test."""
-    async_session_maker = async_sessionmaker(
-        bind=async_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autoflush=False,
-    )
+    """Create a database session inside a transaction rolled back after each test.
+
+    The session joins the test's outer transaction through SAVEPOINTs, so a
+    commit by the code under test never outlives the test.
+    """
+    async with async_engine.connect() as conn:
+        await conn.begin()
+        async_session_maker = async_sessionmaker(
+            bind=conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        )
+        async with async_session_maker() as session:
+            yield session
+        await conn.rollback()
 
-    async with async_session_maker() as session:
-        yield session
-        await session.rollback()
 
+@pytest_asyncio.fixture
+async def seed_template(db_session: AsyncSession) -> Template:
+    """A template inserted in the test's own transaction, rolled back with it.
 
-# ============================================================================
-# Mock Storage Fixture
-# ============================================================================
+    Tests that only need an existing template to point at can take this
+    instead of building their own.
+    """
+    template = Template(name="Seed Template")
+    db_session.add(template)
+    await db_session.flush()
+    return template
 
 
-class MockStorageService:
-    """In-memory mock for S3 storage service."""
+@pytest_asyncio.fixture
+async def seed_template_version(
+    db_session: AsyncSession, seed_template: Template
+) -> TemplateVersion:
+    """Version 1 of the seed template, scoped the same way as seed_template."""
+    version = TemplateVersion(
+        template_id=seed_template.id,
+        version_number=1,
+        source_doc_path="templates/seed/1/source.docx",
+    )
+    db_session.add(version)
+    await db_session.flush()
+    return version
 
-    def __init__(self):
-        self._files: dict[str, bytes] = {}
-
-    def upload_template_source(self, template_id, version, file_obj) -> str:
-        key = f"templates/{template_id}/{version}/source.docx"
-        if hasattr(file_obj, "read"):
-            content = file_obj.read()
-            if hasattr(file_obj, "seek"):
-                file_obj.seek(0)
-        else:
-            content = file_obj
-        self._files[key] = content
-        return key
-
-    def upload_template_parsed(self, template_id, version, file_obj) -> str:
-        key = f"templates/{template_id}/{version}/parsed.json"
-        if hasattr(file_obj, "read"):
-            content = file_obj.read()
-            if hasattr(file_obj, "seek"):
-                file_obj.seek(0)
-        else:
-            content = file_obj
-        self._files[key] = content
-        return key
-
-    def upload_template_parsed_json(self, template_id, version, parsed_data) -> str:
-        import json
-
-        key = f"templates/{template_id}/{version}/parsed.json"
-        self._files[key] = json.dumps(parsed_data).encode()
-        return key
-
-    def upload_document_output(self, document_id, version, file_obj) -> str:
-        key = f"documents/{document_id}/{version}/output.docx"
-        if hasattr(file_obj, "read"):
-            content = file_obj.read()
-            if hasattr(file_obj, "seek"):
-                file_obj.seek(0)
-        else:
-            content = file_obj
-        self._files[key] = content
-        return key
-
-    def get_document_output(self, document_id, version) -> bytes | None:
-        key = f"documents/{document_id}/{version}/output.docx"
-        return self._files.get(key)
-
-    def document_output_exists(self, document_id, version) -> bool:
-        key = f"documents/{document_id}/{version}/output.docx"
-        return key in self._files
-
-    def get_file(self, key: str) -> bytes | None:
-        return self._files.get(key)
-
-    def get_template_source(self, template_id, version) -> bytes | None:
-        key = f"templates/{template_id}/{version}/source.docx"
-        return self._files.get(key)
-
-    def get_template_parsed(self, template_id, version) -> dict | None:
-        import json
-
-        key = f"templates/{template_id}/{version}/parsed.json"
-        data = self._files.get(key)
-        if data:
-            return json.loads(data.decode())
-        return None
-
-    def file_exists(self, key: str) -> bool:
-        return key in self._files
-
-    def template_source_exists(self, template_id, version) -> bool:
-        key = f"templates/{template_id}/{version}/source.docx"
-        return key in self._files
-
-    def template_parsed_exists(self, template_id, version) -> bool:
-        key = f"templates/{template_id}/{version}/parsed.json"
-        return key in self._files
-
-    def delete_file(self, key: str) -> bool:
-        if key in self._files:
-            del self._files[key]
-            return True
-        return False
 
-    def clear(self):
-        """Clear all stored files."""
-        self._files.clear()
+@pytest_asyncio.fixture
+async def seed_document(
+    db_session: AsyncSession, seed_template_version: TemplateVersion
+) -> Document:
+    """A document on the seed template version, scoped the same way as seed_template."""
+    document = Document(template_version_id=seed_template_version.id)
+    db_session.add(document)
+    await db_session.flush()
+    return document
+
+
+# ============================================================================
+# Mock Storage Fixture
+# ============================================================================
 
 
 @pytest.fixture
@@ -365,6 +376,17 @@ async def section_repository(db_session):
 # ============================================================================
 
 
+# The fixed "feed" prefix keeps every hex form non-numeric: SQLite gives the
+# postgresql UUID column NUMERIC affinity and would store all-digit values as ints.
+_uid_counter = itertools.count(0xFEED << 112)
+
+
+@pytest.fixture(scope="session")
+def uid_factory() -> Callable[[], UUID]:
+    """Factory for unique UUIDs from a process-wide counter (no urandom reads)."""
+    return lambda: UUID(int=next(_uid_counter))
+
+
 @pytest.fixture
 def sample_template_data():
     """Factory for creating sample template data."""
@@ -375,6 +397,21 @@ def sample_template_data():
     return _create
 
 
+@pytest.fixture
+def make_template_version(template_repository) -> Callable[..., Awaitable[TemplateVersion]]:
+    """Factory persisting a new template with a single version, returning the version."""
+
+    async def _create(name: str = "Test Template", version_number: int = 1) -> TemplateVersion:
+        version = TemplateVersion(
+            version_number=version_number,
+            source_doc_path=f"templates/test/{version_number}/source.docx",
+        )
+        await template_repository.create_with_versions(Template(name=name), [version])
+        return version
+
+    return _create
+
+
 @pytest.fixture
 def sample_docx_content():
     """Create a minimal valid .docx file content for testing."""
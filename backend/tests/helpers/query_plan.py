@@ -0,0 +1,19 @@
+"""SQLite query-plan helpers for asserting repository queries hit their indexes."""
+
+from sqlalchemy import Executable, text
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def query_plan(session: AsyncSession, statement: Executable) -> list[str]:
+    """Return the detail column of SQLite's EXPLAIN QUERY PLAN for a repository statement."""
+    sql = statement.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True})
+    result = await session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+    return [row[-1] for row in result]
+
+
+def uses_index_without_sort(plan: list[str], index_name: str) -> bool:
+    """True when the plan searches the named index and needs no separate sort step."""
+    return any(index_name in detail for detail in plan) and not any(
+        "TEMP B-TREE" in detail for detail in plan
+    )
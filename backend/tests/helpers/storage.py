@@ -0,0 +1,91 @@
+"""In-memory stand-in for the S3 storage service, shared by fixtures and tests."""
+
+import json
+
+
+class MockStorageService:
+    """In-memory mock for S3 storage service."""
+
+    def __init__(self):
+        self._files: dict[str, bytes] = {}
+
+    def upload_template_source(self, template_id, version, file_obj) -> str:
+        key = f"templates/{template_id}/{version}/source.docx"
+        if hasattr(file_obj, "read"):
+            content = file_obj.read()
+            if hasattr(file_obj, "seek"):
+                file_obj.seek(0)
+        else:
+            content = file_obj
+        self._files[key] = content
+        return key
+
+    def upload_template_parsed(self, template_id, version, file_obj) -> str:
+        key = f"templates/{template_id}/{version}/parsed.json"
+        if hasattr(file_obj, "read"):
+            content = file_obj.read()
+            if hasattr(file_obj, "seek"):
+                file_obj.seek(0)
+        else:
+            content = file_obj
+        self._files[key] = content
+        return key
+
+    def upload_template_parsed_json(self, template_id, version, parsed_data) -> str:
+        key = f"templates/{template_id}/{version}/parsed.json"
+        self._files[key] = json.dumps(parsed_data).encode()
+        return key
+
+    def upload_document_output(self, document_id, version, file_obj) -> str:
+        key = f"documents/{document_id}/{version}/output.docx"
+        if hasattr(file_obj, "read"):
+            content = file_obj.read()
+            if hasattr(file_obj, "seek"):
+                file_obj.seek(0)
+        else:
+            content = file_obj
+        self._files[key] = content
+        return key
+
+    def get_document_output(self, document_id, version) -> bytes | None:
+        key = f"documents/{document_id}/{version}/output.docx"
+        return self._files.get(key)
+
+    def document_output_exists(self, document_id, version) -> bool:
+        key = f"documents/{document_id}/{version}/output.docx"
+        return key in self._files
+
+    def get_file(self, key: str) -> bytes | None:
+        return self._files.get(key)
+
+    def get_template_source(self, template_id, version) -> bytes | None:
+        key = f"templates/{template_id}/{version}/source.docx"
+        return self._files.get(key)
+
+    def get_template_parsed(self, template_id, version) -> dict | None:
+        key = f"templates/{template_id}/{version}/parsed.json"
+        data = self._files.get(key)
+        if data:
+            return json.loads(data)
+        return None
+
+    def file_exists(self, key: str) -> bool:
+        return key in self._files
+
+    def template_source_exists(self, template_id, version) -> bool:
+        key = f"templates/{template_id}/{version}/source.docx"
+        return key in self._files
+
+    def template_parsed_exists(self, template_id, version) -> bool:
+        key = f"templates/{template_id}/{version}/parsed.json"
+        return key in self._files
+
+    def delete_file(self, key: str) -> bool:
+        if key in self._files:
+            del self._files[key]
+            return True
+        return False
+
+    def clear(self):
+        """Clear all stored files."""
+        self._files.clear()
@@ -0,0 +1,28 @@
+import pytest
+
+from backend.app.domains.section.classification_service import (
+    ClassificationService,
+    create_classification_service,
+)
+from backend.app.domains.section.models import Section
+
+
+class StubSectionRepo:
+    def __init__(self) -> None:
+        self.created_sections: list[Section] = []
+
+    async def create_batch(self, sections: list[Section]) -> list[Section]:
+        self.created_sections.extend(sections)
+        return sections
+
+
+@pytest.fixture
+def stub_section_repo() -> StubSectionRepo:
+    return StubSectionRepo()
+
+
+@pytest.fixture(scope="session")
+def classification_service() -> ClassificationService:
+    # The service keeps no per-call state (the section repo is passed to each call),
+    # so one rule-only instance at the default threshold serves every test.
+    return create_classification_service(llm_config=None, confidence_threshold=0.85)
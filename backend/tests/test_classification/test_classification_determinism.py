@@ -1,5 +1,4 @@
 import hashlib
-from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -80,12 +79,6 @@ class TestRuleBasedDeterminism:
 
 
 class TestServiceDeterminism:
-    @pytest.fixture
-    def mock_section_repo(self):
-        mock_repo = MagicMock()
-        mock_repo.create_batch = AsyncMock(return_value=[])
-        return mock_repo
-
     @pytest.fixture
     def sample_document(self):
         return ParsedDocument(
@@ -114,22 +107,18 @@ class TestServiceDeterminism:
         )
 
     @pytest.mark.asyncio
-    async def test_service_produces_identical_results(self, mock_section_repo, sample_document):
+    async def test_service_produces_identical_results(self, stub_section_repo, sample_document):
         service = create_classification_service(
             llm_config=None,
             confidence_threshold=0.85,
         )
-        mock_repo1 = MagicMock()
-        mock_repo1.create_batch = AsyncMock(return_value=[])
-        mock_repo2 = MagicMock()
-        mock_repo2.create_batch = AsyncMock(return_value=[])
         result1 = await service.classify_template_sections(
             parsed_document=sample_document,
-            section_repo=mock_repo1,
+            section_repo=stub_section_repo,
         )
         result2 = await service.classify_template_sections(
             parsed_document=sample_document,
-            section_repo=mock_repo2,
+            section_repo=stub_section_repo,
         )
         assert result1.total_sections == result2.total_sections
         assert result1.static_sections == result2.static_sections
@@ -137,22 +126,18 @@ class TestServiceDeterminism:
         assert result1.rule_based_count == result2.rule_based_count
 
     @pytest.mark.asyncio
-    async def test_classifications_match_exactly(self, sample_document):
+    async def test_classifications_match_exactly(self, stub_section_repo, sample_document):
         service = create_classification_service(
             llm_config=None,
             confidence_threshold=0.85,
         )
-        mock_repo1 = MagicMock()
-        mock_repo1.create_batch = AsyncMock(return_value=[])
-        mock_repo2 = MagicMock()
-        mock_repo2.create_batch = AsyncMock(return_value=[])
         result1 = await service.classify_template_sections(
             parsed_document=sample_document,
-            section_repo=mock_repo1,
+            section_repo=stub_section_repo,
         )
         result2 = await service.classify_template_sections(
             parsed_document=sample_document,
-            section_repo=mock_repo2,
+            section_repo=stub_section_repo,
         )
         for c1, c2 in zip(result1.classifications, result2.classifications):
             assert c1.section_id == c2.section_id
@@ -201,22 +186,20 @@ class TestIdempotentClassification:
         )
 
     @pytest.mark.asyncio
-    async def test_idempotent_classification_no_state_change(self, sample_document):
+    async def test_idempotent_classification_no_state_change(
+        self, stub_section_repo, sample_document
+    ):
         service = create_classification_service(
             llm_config=None,
             confidence_threshold=0.85,
         )
-        mock_repo = MagicMock()
-        mock_repo.create_batch = AsyncMock(return_value=[])
         result1 = await service.classify_template_sections(
             parsed_document=sample_document,
-            section_repo=mock_repo,
+            section_repo=stub_section_repo,
         )
-        mock_repo2 = MagicMock()
-        mock_repo2.create_batch = AsyncMock(return_value=[])
         result2 = await service.classify_template_sections(
             parsed_document=sample_document,
-            section_repo=mock_repo2,
+            section_repo=stub_section_repo,
         )
         assert result1.total_sections == result2.total_sections
         assert result1.static_sections == result2.static_sections
@@ -363,22 +346,18 @@ class TestBatchProcessingDeterminism:
         )
 
     @pytest.mark.asyncio
-    async def test_batch_results_are_deterministic(self, large_document):
+    async def test_batch_results_are_deterministic(self, stub_section_repo, large_document):
         service = create_classification_service(
             llm_config=None,
             confidence_threshold=0.85,
         )
-        mock_repo1 = MagicMock()
-        mock_repo1.create_batch = AsyncMock(return_value=[])
-        mock_repo2 = MagicMock()
-        mock_repo2.create_batch = AsyncMock(return_value=[])
         result1 = await service.classify_template_sections(
             parsed_document=large_document,
-            section_repo=mock_repo1,
+            section_repo=stub_section_repo,
         )
         result2 = await service.classify_template_sections(
             parsed_document=large_document,
-            section_repo=mock_repo2,
+            section_repo=stub_section_repo,
         )
         assert result1.total_sections == result2.total_sections
         assert result1.static_sections == result2.static_sections
@@ -391,23 +370,19 @@ class TestBatchProcessingDeterminism:
         assert result1.low_confidence_count == result2.low_confidence_count
 
     @pytest.mark.asyncio
-    async def test_all_classifications_match_in_batch(self, large_document):
+    async def test_all_classifications_match_in_batch(self, stub_section_repo, large_document):
         service = create_classification_service(
             llm_config=None,
             confidence_threshold=0.85,
         )
 
-        mock_repo1 = MagicMock()
-        mock_repo1.create_batch = AsyncMock(return_value=[])
-        mock_repo2 = MagicMock()
-        mock_repo2.create_batch = AsyncMock(return_value=[])
         result1 = await service.classify_template_sections(
             parsed_document=large_document,
-            section_repo=mock_repo1,
+            section_repo=stub_section_repo,
         )
         result2 = await service.classify_template_sections(
             parsed_document=large_document,
-            section_repo=mock_repo2,
+            section_repo=stub_section_repo,
         )
         for c1, c2 in zip(result1.classifications, result2.classifications):
             assert (
@@ -1,4 +1,7 @@
-from unittest.mock import AsyncMock, MagicMock
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
@@ -13,12 +16,14 @@ from backend.app.domains.parsing.schemas import (
 from backend.app.domains.section.classification_schemas import (
     ClassificationConfidence,
     ClassificationMethod,
+    SectionClassificationResult,
 )
 from backend.app.domains.section.classification_service import (
     ClassificationService,
     create_classification_service,
 )
-from backend.app.domains.section.llm_classifier import LLMClassifierConfig
+from backend.app.domains.section.llm_classifier import LLMClassifier, LLMClassifierConfig
+from backend.app.domains.section.rule_based_classifier import get_rule_based_classifier
 
 
 class TestClassificationServiceInitialization:
@@ -48,6 +53,11 @@ class TestClassificationServiceInitialization:
         service = create_classification_service(llm_config=llm_config)
         assert service.llm_classifier is not None
 
+    @pytest.mark.parametrize("max_concurrent_llm_calls", [0, -1])
+    def test_non_positive_llm_concurrency_rejected(self, max_concurrent_llm_calls):
+        with pytest.raises(ValueError):
+            create_classification_service(max_concurrent_llm_calls=max_concurrent_llm_calls)
+
 
 class TestFallbackClassification:
     @pytest.fixture
@@ -243,13 +253,35 @@ class TestContextBuilding:
         assert "next_block_type" not in context or context["next_block_type"] is None
 
 
-class TestEveryBlockGetsClassified:
-    @pytest.fixture
-    def mock_section_repo(self):
-        mock_repo = MagicMock()
-        mock_repo.create_batch = AsyncMock(return_value=[])
-        return mock_repo
+class TestPrecomputedBlockTypes:
+    def test_precomputed_types_match_per_block_context(self):
+        service = create_classification_service(confidence_threshold=0.85)
+        blocks = [
+            HeadingBlock(
+                block_id="blk_hdg_0000_xyz",
+                sequence=0,
+                level=1,
+                runs=[TextRun(text="Heading")],
+            ),
+            ParagraphBlock(
+                block_id="blk_par_0001_xyz",
+                sequence=1,
+                runs=[TextRun(text="Paragraph")],
+            ),
+            ParagraphBlock(
+                block_id="blk_par_0002_xyz",
+                sequence=2,
+                runs=[TextRun(text="Paragraph")],
+            ),
+        ]
+        block_types = [service._block_type(block) for block in blocks]
+        for i in range(len(blocks)):
+            assert service._build_context(i, blocks, block_types) == service._build_context(
+                i, blocks
+            )
+
 
+class TestEveryBlockGetsClassified:
     @pytest.fixture
     def sample_document(self):
         return ParsedDocument(
@@ -269,21 +301,21 @@ class TestEveryBlockGetsClassified:
         )
 
     @pytest.mark.asyncio
-    async def test_all_blocks_get_classified(self, mock_section_repo, sample_document):
+    async def test_all_blocks_get_classified(self, stub_section_repo, sample_document):
         service = create_classification_service(confidence_threshold=0.85)
         result = await service.classify_template_sections(
             parsed_document=sample_document,
-            section_repo=mock_section_repo,
+            section_repo=stub_section_repo,
         )
         assert result.total_sections == len(sample_document.blocks)
         assert len(result.classifications) == len(sample_document.blocks)
 
     @pytest.mark.asyncio
-    async def test_no_unclassified_sections(self, mock_section_repo, sample_document):
+    async def test_no_unclassified_sections(self, stub_section_repo, sample_document):
         service = create_classification_service(confidence_threshold=0.95)
         result = await service.classify_template_sections(
             parsed_document=sample_document,
-            section_repo=mock_section_repo,
+            section_repo=stub_section_repo,
         )
         for classification in result.classifications:
             assert classification.section_type in ["STATIC", "DYNAMIC"]
@@ -291,22 +323,16 @@ class TestEveryBlockGetsClassified:
             assert classification.confidence_score <= 1.0
 
     @pytest.mark.asyncio
-    async def test_static_and_dynamic_counts_add_up(self, mock_section_repo, sample_document):
+    async def test_static_and_dynamic_counts_add_up(self, stub_section_repo, sample_document):
         service = create_classification_service(confidence_threshold=0.85)
         result = await service.classify_template_sections(
             parsed_document=sample_document,
-            section_repo=mock_section_repo,
+            section_repo=stub_section_repo,
         )
         assert result.static_sections + result.dynamic_sections == result.total_sections
 
 
 class TestConfidenceThresholdBehavior:
-    @pytest.fixture
-    def mock_section_repo(self):
-        mock_repo = MagicMock()
-        mock_repo.create_batch = AsyncMock(return_value=[])
-        return mock_repo
-
     def test_high_threshold_uses_more_fallback(self):
         service_low = create_classification_service(confidence_threshold=0.60)
         block = ParagraphBlock(
@@ -335,14 +361,8 @@ class TestConfidenceThresholdBehavior:
 
 
 class TestBatchResultStatistics:
-    @pytest.fixture
-    def mock_section_repo(self):
-        mock_repo = MagicMock()
-        mock_repo.create_batch = AsyncMock(return_value=[])
-        return mock_repo
-
     @pytest.mark.asyncio
-    async def test_statistics_are_computed(self, mock_section_repo):
+    async def test_statistics_are_computed(self, stub_section_repo):
         document = ParsedDocument(
             template_version_id=uuid4(),
             template_id=uuid4(),
@@ -366,7 +386,7 @@ class TestBatchResultStatistics:
         service = create_classification_service(confidence_threshold=0.85)
         result = await service.classify_template_sections(
             parsed_document=document,
-            section_repo=mock_section_repo,
+            section_repo=stub_section_repo,
         )
         assert result.total_sections == 2
         assert result.static_sections >= 0
@@ -374,7 +394,7 @@ class TestBatchResultStatistics:
         assert result.duration_ms >= 0
 
     @pytest.mark.asyncio
-    async def test_method_breakdown_tracked(self, mock_section_repo):
+    async def test_method_breakdown_tracked(self, stub_section_repo):
         document = ParsedDocument(
             template_version_id=uuid4(),
             template_id=uuid4(),
@@ -396,7 +416,7 @@ class TestBatchResultStatistics:
         )
         result = await service.classify_template_sections(
             parsed_document=document,
-            section_repo=mock_section_repo,
+            section_repo=stub_section_repo,
         )
         assert result.rule_based_count >= 0
         assert result.llm_assisted_count >= 0
@@ -407,7 +427,7 @@ class TestBatchResultStatistics:
         )
 
     @pytest.mark.asyncio
-    async def test_confidence_breakdown_tracked(self, mock_section_repo):
+    async def test_confidence_breakdown_tracked(self, stub_section_repo):
         document = ParsedDocument(
             template_version_id=uuid4(),
             template_id=uuid4(),
@@ -426,7 +446,7 @@ class TestBatchResultStatistics:
         service = create_classification_service(confidence_threshold=0.85)
         result = await service.classify_template_sections(
             parsed_document=document,
-            section_repo=mock_section_repo,
+            section_repo=stub_section_repo,
         )
         assert result.high_confidence_count >= 0
         assert result.medium_confidence_count >= 0
@@ -437,3 +457,137 @@ class TestBatchResultStatistics:
             + result.low_confidence_count
         )
         assert total_conf == result.total_sections
+
+
+class TestConcurrentLLMClassification:
+    @pytest.fixture
+    def document(self):
+        return ParsedDocument(
+            template_version_id=uuid4(),
+            template_id=uuid4(),
+            version_number=1,
+            content_hash="test_hash",
+            metadata=DocumentMetadata(),
+            blocks=[
+                ParagraphBlock(
+                    block_id="blk_par_0000_xyz",
+                    sequence=0,
+                    runs=[TextRun(text="This is confidential information.")],
+                ),
+            ]
+            + [
+                ParagraphBlock(
+                    block_id=f"blk_par_{i:04d}_xyz",
+                    sequence=i,
+                    runs=[TextRun(text=f"The meeting was held on day {i} afternoon.")],
+                )
+                for i in range(1, 9)
+            ],
+        )
+
+    def _llm_classifier(self, delay: float = 0.02):
+        state = {"in_flight": 0, "max_in_flight": 0}
+        lock = threading.Lock()
+
+        def classify(block, context):
+            with lock:
+                state["in_flight"] += 1
+                state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            time.sleep(delay)
+            with lock:
+                state["in_flight"] -= 1
+            return SectionClassificationResult(
+                section_id=block.block_id,
+                section_type="DYNAMIC",
+                confidence_score=0.95,
+                confidence_level=ClassificationConfidence.HIGH,
+                method=ClassificationMethod.LLM_ASSISTED,
+                justification="LLM-assisted: test",
+            )
+
+        llm_classifier = MagicMock()
+        llm_classifier.classify = MagicMock(side_effect=classify)
+        return llm_classifier, state
+
+    @pytest.mark.asyncio
+    async def test_llm_calls_bounded_and_order_preserved(self, stub_section_repo, document):
+        llm_classifier, state = self._llm_classifier()
+        service = ClassificationService(
+            rule_classifier=get_rule_based_classifier(0.85),
+            llm_classifier=llm_classifier,
+            confidence_threshold=0.85,
+            max_concurrent_llm_calls=3,
+        )
+        result = await service.classify_template_sections(
+            parsed_document=document,
+            section_repo=stub_section_repo,
+        )
+        assert [c.section_id for c in result.classifications] == [
+            b.block_id for b in document.blocks
+        ]
+        assert result.classifications[0].method == ClassificationMethod.RULE_BASED
+        assert result.llm_assisted_count == len(document.blocks) - 1
+        assert 1 < state["max_in_flight"] <= 3
+
+    @pytest.mark.asyncio
+    async def test_llm_failure_falls_back_for_that_block(self, stub_section_repo, document):
+        llm_classifier, _ = self._llm_classifier(delay=0)
+        original = llm_classifier.classify.side_effect
+
+        def classify(block, context):
+            if block.block_id == "blk_par_0003_xyz":
+                raise RuntimeError("boom")
+            return original(block, context)
+
+        llm_classifier.classify.side_effect = classify
+        service = ClassificationService(
+            rule_classifier=get_rule_based_classifier(0.85),
+            llm_classifier=llm_classifier,
+        )
+        result = await service.classify_template_sections(
+            parsed_document=document,
+            section_repo=stub_section_repo,
+        )
+        assert result.total_sections == len(document.blocks)
+        assert result.classifications[3].method == ClassificationMethod.FALLBACK
+        assert result.errors == ["Failed to classify block blk_par_0003_xyz: boom"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_llm_calls_share_one_client(self, stub_section_repo, document):
+        created = []
+        response = MagicMock()
+        response.json.return_value = {
+            "choices": [
+                {
+                    "message": {
+                        "content": json.dumps(
+                            {"classification": "DYNAMIC", "confidence": 0.9, "reasoning": "test"}
+                        )
+                    }
+                }
+            ]
+        }
+
+        def slow_client(**kwargs):
+            # Widen the window between the None check and the assignment
+            time.sleep(0.02)
+            client = MagicMock()
+            client.post.return_value = response
+            created.append(client)
+            return client
+
+        llm_classifier = LLMClassifier(LLMClassifierConfig(api_key="test-key"))
+        service = ClassificationService(
+            rule_classifier=get_rule_based_classifier(0.85),
+            llm_classifier=llm_classifier,
+            max_concurrent_llm_calls=4,
+        )
+        with patch("backend.app.domains.section.llm_classifier.httpx.Client", slow_client):
+            result = await service.classify_template_sections(
+                parsed_document=document,
+                section_repo=stub_section_repo,
+            )
+
+        assert len(created) == 1
+        assert created[0].post.call_count == len(document.blocks) - 1
+        assert result.llm_assisted_count == len(document.blocks) - 1
@@ -0,0 +1,62 @@
+import pytest
+
+from backend.app.domains.section.keyword_trie import KeywordTrie
+from backend.app.domains.section.rule_based_classifier import RuleBasedClassifier
+
+
+class TestKeywordTrieMatching:
+    @pytest.fixture
+    def trie(self):
+        trie = KeywordTrie()
+        trie.add("All Rights Reserved", "rights")
+        trie.add("all rights", "partial")
+        trie.add("tel:", "contact", trailing_boundary=False)
+        trie.build()
+        return trie
+
+    def test_shared_prefixes_both_match(self, trie):
+        assert trie.scan("© 2026 all rights reserved.") == {"rights", "partial"}
+
+    def test_keywords_are_case_folded(self, trie):
+        assert "rights" in trie.scan("all rights reserved")
+
+    def test_leading_word_boundary_required(self, trie):
+        assert trie.scan("hotel: downtown") == set()
+
+    def test_trailing_word_boundary_required(self, trie):
+        assert trie.scan("all rightsholders") == set()
+
+    def test_trailing_boundary_optional(self, trie):
+        assert trie.scan("tel:+1-555-0123") == {"contact"}
+
+    def test_failure_links_recover_overlapping_match(self):
+        trie = KeywordTrie()
+        trie.add("insert", "insert")
+        trie.build()
+        assert trie.scan("ins insert") == {"insert"}
+
+    def test_empty_keyword_rejected(self):
+        with pytest.raises(ValueError):
+            KeywordTrie().add("", "empty")
+
+
+class TestKeywordTrieMatchesRegex:
+    SAMPLES = [
+        "This document contains confidential and privileged information.",
+        "© 2026 Advisory Corp. All Rights Reserved.",
+        "Tel: +1-555-0123 | Email: info@advisory.com",
+        "Hotel: downtown, emails sent daily",
+        "Dear {client_name}, we are pleased to present...",
+        "[To be completed by advisor based on client requirements]",
+        "Based on our analysis for Client Name, we recommend...",
+        "The update was inserted on the dated amountless form",
+        "Client-specific pricing is personalized per engagement",
+        "Nonconfidential copyrighted disclaimers",
+        "",
+    ]
+
+    @pytest.mark.parametrize("text", SAMPLES)
+    def test_trie_agrees_with_regex(self, text):
+        hits = RuleBasedClassifier.KEYWORD_TRIE.scan(text.lower())
+        for pattern in RuleBasedClassifier.TRIE_PATTERNS:
+            assert (pattern in hits) == (pattern.search(text) is not None), pattern.pattern
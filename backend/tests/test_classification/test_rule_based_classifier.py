@@ -11,7 +11,10 @@ from backend.app.domains.section.classification_schemas import (
     ClassificationConfidence,
     ClassificationMethod,
 )
-from backend.app.domains.section.rule_based_classifier import RuleBasedClassifier
+from backend.app.domains.section.rule_based_classifier import (
+    RuleBasedClassifier,
+    get_rule_based_classifier,
+)
 
 
 class TestRuleBasedClassifierInitialization:
@@ -27,19 +30,51 @@ class TestRuleBasedClassifierInitialization:
         classifier = RuleBasedClassifier(confidence_threshold=0.90)
         assert classifier.confidence_threshold == 0.90
 
+    def test_shared_classifier_reused_per_threshold(self):
+        assert get_rule_based_classifier(0.85) is get_rule_based_classifier(0.85)
+        assert get_rule_based_classifier(0.70) is not get_rule_based_classifier(0.85)
+        assert get_rule_based_classifier(0.70).confidence_threshold == 0.70
+
+
+def _paragraph(block_id: str, sequence: int, text: str) -> ParagraphBlock:
+    return ParagraphBlock.model_construct(
+        block_id=block_id, sequence=sequence, runs=[TextRun.model_construct(text=text)]
+    )
+
+
+@pytest.fixture(scope="session")
+def static_pattern_blocks():
+    return {
+        "legal_disclaimer": _paragraph(
+            "blk_par_0001_abc123",
+            1,
+            "This document contains confidential and privileged information.",
+        ),
+        "copyright": _paragraph(
+            "blk_par_0002_def456", 2, "© 2026 Advisory Corp. All Rights Reserved."
+        ),
+        "boilerplate": _paragraph(
+            "blk_par_0003_ghi789",
+            3,
+            "This document was prepared by our professional advisory team.",
+        ),
+        "contact": _paragraph(
+            "blk_par_0004_jkl012", 4, "Tel: +1-555-0123 | Email: info@advisory.com"
+        ),
+        "page_number": _paragraph("blk_par_0005_mno345", 5, "Page 1 of 10"),
+        "internal_use_only": _paragraph(
+            "blk_par_0006_pqr678", 6, "INTERNAL USE ONLY - PROPRIETARY"
+        ),
+    }
+
 
 class TestStaticPatternClassification:
     @pytest.fixture
     def classifier(self):
-        return RuleBasedClassifier(confidence_threshold=0.85)
+        return get_rule_based_classifier(0.85)
 
-    def test_legal_disclaimer_classified_as_static(self, classifier):
-        block = ParagraphBlock(
-            block_id="blk_par_0001_abc123",
-            sequence=1,
-            runs=[TextRun(text="This document contains confidential and privileged information.")],
-        )
-        result = classifier.classify(block, {})
+    def test_legal_disclaimer_classified_as_static(self, classifier, static_pattern_blocks):
+        result = classifier.classify(static_pattern_blocks["legal_disclaimer"], {})
         assert result is not None
         assert result.section_type == "STATIC"
         assert result.confidence_score >= 0.90
@@ -49,65 +84,44 @@ class TestStaticPatternClassification:
             or "legal" in result.justification.lower()
         )
 
-    def test_copyright_notice_classified_as_static(self, classifier):
-        block = ParagraphBlock(
-            block_id="blk_par_0002_def456",
-            sequence=2,
-            runs=[TextRun(text="© 2026 Advisory Corp. All Rights Reserved.")],
-        )
-        result = classifier.classify(block, {})
+    def test_copyright_notice_classified_as_static(self, classifier, static_pattern_blocks):
+        result = classifier.classify(static_pattern_blocks["copyright"], {})
         assert result is not None
         assert result.section_type == "STATIC"
         assert result.confidence_score >= 0.90
 
-    def test_boilerplate_text_classified_as_static(self, classifier):
-        block = ParagraphBlock(
-            block_id="blk_par_0003_ghi789",
-            sequence=3,
-            runs=[TextRun(text="This document was prepared by our professional advisory team.")],
-        )
-        result = classifier.classify(block, {})
+    def test_boilerplate_text_classified_as_static(self, classifier, static_pattern_blocks):
+        result = classifier.classify(static_pattern_blocks["boilerplate"], {})
         assert result is not None
         assert result.section_type == "STATIC"
         assert result.confidence_score >= 0.85
 
-    def test_contact_information_classified_as_static(self, classifier):
-        block = ParagraphBlock(
-            block_id="blk_par_0004_jkl012",
-            sequence=4,
-            runs=[TextRun(text="Tel: +1-555-0123 | Email: info@advisory.com")],
-        )
-        result = classifier.classify(block, {})
+    def test_contact_information_classified_as_static(self, classifier, static_pattern_blocks):
+        result = classifier.classify(static_pattern_blocks["contact"], {})
         assert result is not None
         assert result.section_type == "STATIC"
         assert result.confidence_score >= 0.85
 
-    def test_page_number_classified_as_static(self, classifier):
-        block = ParagraphBlock(
-            block_id="blk_par_0005_mno345",
-            sequence=5,
-            runs=[TextRun(text="Page 1 of 10")],
-        )
-        result = classifier.classify(block, {})
+    def test_page_number_classified_as_static(self, classifier, static_pattern_blocks):
+        result = classifier.classify(static_pattern_blocks["page_number"], {})
         assert result is not None
         assert result.section_type == "STATIC"
         assert result.confidence_score >= 0.90
 
-    def test_internal_use_only_classified_as_static(self, classifier):
-        block = ParagraphBlock(
-            block_id="blk_par_0006_pqr678",
-            sequence=6,
-            runs=[TextRun(text="INTERNAL USE ONLY - PROPRIETARY")],
-        )
-        result = classifier.classify(block, {})
+    def test_internal_use_only_classified_as_static(self, classifier, static_pattern_blocks):
+        result = classifier.classify(static_pattern_blocks["internal_use_only"], {})
         assert result is not None
         assert result.section_type == "STATIC"
 
+    def test_prebuilt_blocks_are_valid_models(self, static_pattern_blocks):
+        for block in static_pattern_blocks.values():
+            assert ParagraphBlock.model_validate(block.model_dump()) == block
+
 
 class TestDynamicPatternClassification:
     @pytest.fixture
     def classifier(self):
-        return RuleBasedClassifier(confidence_threshold=0.85)
+        return get_rule_based_classifier(0.85)
 
     def test_placeholder_curly_braces_classified_as_dynamic(self, classifier):
         block = ParagraphBlock(
@@ -177,7 +191,7 @@ class TestDynamicPatternClassification:
 class TestStructuralIndicatorClassification:
     @pytest.fixture
     def classifier(self):
-        return RuleBasedClassifier(confidence_threshold=0.70)
+        return get_rule_based_classifier(0.70)
 
     def test_header_block_classified_as_static(self, classifier):
         block = HeaderFooterBlock(
@@ -205,6 +219,23 @@ class TestStructuralIndicatorClassification:
         assert result.section_type == "STATIC"
         assert result.confidence_score >= 0.90
 
+    def test_blank_blocks_skip_pattern_scan(self, monkeypatch):
+        # A private instance: the classifier fixture is shared through the factory's cache
+        classifier = RuleBasedClassifier(confidence_threshold=0.70)
+        monkeypatch.setattr(
+            classifier, "_match_patterns", lambda *args: pytest.fail("patterns scanned")
+        )
+        block = HeaderFooterBlock(
+            block_type=BlockType.FOOTER,
+            block_id="blk_ftr_0002_xyz",
+            sequence=0,
+            header_footer_type="default",
+            content=[],
+        )
+        result = classifier.classify(block, {})
+        assert result is not None
+        assert result.section_type == "STATIC"
+
     def test_level_one_heading_classified_as_static(self, classifier):
         block = HeadingBlock(
             block_id="blk_hdg_0001_abc",
@@ -220,7 +251,7 @@ class TestStructuralIndicatorClassification:
 class TestContentHeuristicClassification:
     @pytest.fixture
     def classifier(self):
-        return RuleBasedClassifier(confidence_threshold=0.70)
+        return get_rule_based_classifier(0.70)
 
     def test_very_short_content_classified_as_static(self, classifier):
         block = ParagraphBlock(
@@ -261,10 +292,49 @@ class TestContentHeuristicClassification:
         assert result.section_type == "DYNAMIC"
 
 
+class TestHeuristicThresholdShortCircuit:
+    TEXTS = [
+        "Appendix",
+        "APPENDIX A",
+        "Based on our comprehensive analysis " * 12,
+    ]
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_heuristics_never_exceed_max_confidence(self, text):
+        classifier = get_rule_based_classifier(0.70)
+        block = _paragraph("blk_par_0060_xyz", 60, text)
+        result = classifier._apply_heuristics(block, text, {})
+        assert result is not None
+        assert result.confidence_score <= RuleBasedClassifier.MAX_HEURISTIC_CONFIDENCE
+
+    def test_max_confidence_matches_heuristic_confidences(self):
+        classifier = get_rule_based_classifier(0.70)
+        scores = {
+            classifier._apply_heuristics(
+                _paragraph("blk_par_0060_xyz", 60, text), text, {}
+            ).confidence_score
+            for text in self.TEXTS
+        }
+        assert scores == {
+            RuleBasedClassifier.SHORT_TEXT_CONFIDENCE,
+            RuleBasedClassifier.ALL_CAPS_CONFIDENCE,
+            RuleBasedClassifier.LONG_NARRATIVE_CONFIDENCE,
+        }
+        assert max(scores) == RuleBasedClassifier.MAX_HEURISTIC_CONFIDENCE
+
+    def test_heuristics_skipped_above_max_confidence(self, monkeypatch):
+        classifier = RuleBasedClassifier(confidence_threshold=0.85)
+        monkeypatch.setattr(
+            classifier, "_apply_heuristics", lambda *args: pytest.fail("heuristics ran")
+        )
+        block = _paragraph("blk_par_0061_xyz", 61, "APPENDIX A")
+        assert classifier.classify(block, {}) is None
+
+
 class TestClassificationDeterminism:
     @pytest.fixture
     def classifier(self):
-        return RuleBasedClassifier(confidence_threshold=0.85)
+        return get_rule_based_classifier(0.85)
 
     def test_same_input_produces_identical_results(self, classifier):
         block = ParagraphBlock(
@@ -317,7 +387,7 @@ class TestClassificationDeterminism:
 class TestNoMatchReturnsNone:
     @pytest.fixture
     def classifier(self):
-        return RuleBasedClassifier(confidence_threshold=0.90)
+        return get_rule_based_classifier(0.90)
 
     def test_ambiguous_content_returns_none(self, classifier):
         block = ParagraphBlock(
@@ -344,7 +414,7 @@ class TestNoMatchReturnsNone:
 class TestConfidenceLevels:
     @pytest.fixture
     def classifier(self):
-        return RuleBasedClassifier(confidence_threshold=0.70)
+        return get_rule_based_classifier(0.70)
 
     def test_high_confidence_level_assignment(self, classifier):
         block = ParagraphBlock(
@@ -1,5 +1,4 @@
 import json
-from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -10,8 +9,10 @@ from backend.app.domains.parsing.schemas import (
     ParsedDocument,
     TextRun,
 )
-from backend.app.domains.section.classification_schemas import ClassificationMethod
-from backend.app.domains.section.classification_service import create_classification_service
+from backend.app.domains.section.classification_schemas import (
+    ClassificationMethod,
+    SectionClassificationResult,
+)
 from backend.app.domains.section.models import Section, SectionType
 from backend.app.domains.section.repository import SectionRepository
 from backend.app.domains.section.schemas import SectionCreate
@@ -75,9 +76,9 @@ class TestSectionRepository:
 
 class TestPromptConfigStorage:
     @pytest.fixture
-    def section_data(self):
+    def section_data(self, uid_factory):
         return {
-            "template_version_id": uuid4(),
+            "template_version_id": uid_factory(),
             "section_type": SectionType.DYNAMIC,
             "structural_path": "body/paragraph[0]",
             "prompt_config": {
@@ -89,10 +90,7 @@ class TestPromptConfigStorage:
 
     def test_prompt_config_serializable(self, section_data):
         config = section_data["prompt_config"]
-        serialized = json.dumps(config)
-        assert serialized is not None
-        deserialized = json.loads(serialized)
-        assert deserialized == config
+        assert json.loads(json.dumps(config)) == config
 
     def test_prompt_config_structure(self, section_data):
         section = SectionCreate(**section_data)
@@ -121,23 +119,10 @@ class TestSectionImmutability:
 
 class TestNoDuplicateSections:
     @pytest.fixture
-    def mock_section_repo(self):
-        mock_repo = MagicMock()
-        mock_repo.created_sections = []
-
-        async def mock_create_batch(sections):
-            for s in sections:
-                mock_repo.created_sections.append(s)
-            return sections
-
-        mock_repo.create_batch = AsyncMock(side_effect=mock_create_batch)
-        return mock_repo
-
-    @pytest.fixture
-    def sample_document(self):
+    def sample_document(self, uid_factory):
         return ParsedDocument(
-            template_version_id=uuid4(),
-            template_id=uuid4(),
+            template_version_id=uid_factory(),
+            template_id=uid_factory(),
             version_number=1,
             content_hash="test_hash",
             metadata=DocumentMetadata(),
@@ -156,39 +141,31 @@ class TestNoDuplicateSections:
         )
 
     @pytest.mark.asyncio
-    async def test_each_block_classified_once(self, mock_section_repo, sample_document):
-        service = create_classification_service(confidence_threshold=0.85)
-        result = await service.classify_template_sections(
+    async def test_each_block_classified_once(
+        self, stub_section_repo, sample_document, classification_service
+    ):
+        result = await classification_service.classify_template_sections(
             parsed_document=sample_document,
-            section_repo=mock_section_repo,
+            section_repo=stub_section_repo,
         )
-        mock_section_repo.create_batch.assert_called()
+        assert len(stub_section_repo.created_sections) == len(sample_document.blocks)
         assert result.total_sections == len(sample_document.blocks)
 
     @pytest.mark.asyncio
-    async def test_idempotent_classification(self, sample_document):
-        service = create_classification_service(
-            llm_config=None,
-            confidence_threshold=0.85,
-        )
-        mock_repo1 = MagicMock()
-        mock_repo1.created_sections = []
-        mock_repo1.create_batch = AsyncMock(
-            side_effect=lambda sections: mock_repo1.created_sections.extend(sections) or sections
-        )
-        result1 = await service.classify_template_sections(
+    async def test_idempotent_classification(
+        self, stub_section_repo, sample_document, classification_service
+    ):
+        result1 = await classification_service.classify_template_sections(
             parsed_document=sample_document,
-            section_repo=mock_repo1,
-        )
-        mock_repo2 = MagicMock()
-        mock_repo2.created_sections = []
-        mock_repo2.create_batch = AsyncMock(
-            side_effect=lambda sections: mock_repo2.created_sections.extend(sections) or sections
+            section_repo=stub_section_repo,
         )
-        result2 = await service.classify_template_sections(
+        result2 = await classification_service.classify_template_sections(
             parsed_document=sample_document,
-            section_repo=mock_repo2,
+            section_repo=stub_section_repo,
         )
+        first_run = stub_section_repo.created_sections[: len(sample_document.blocks)]
+        second_run = stub_section_repo.created_sections[len(sample_document.blocks) :]
+        assert [s.section_type for s in first_run] == [s.section_type for s in second_run]
         assert result1.total_sections == result2.total_sections
         assert result1.static_sections == result2.static_sections
         assert result1.dynamic_sections == result2.dynamic_sections
@@ -198,23 +175,17 @@ class TestNoDuplicateSections:
 
 
 class TestClassificationToPersistenceMapping:
-    @pytest.fixture
-    def mock_section_repo(self):
-        mock_repo = MagicMock()
-        mock_repo.captured_sections = []
-
-        async def capture_batch(sections):
-            mock_repo.captured_sections = sections
-            return sections
-
-        mock_repo.create_batch = AsyncMock(side_effect=capture_batch)
-        return mock_repo
+    def test_classification_schema_has_expected_fields(self):
+        expected = {"section_type", "confidence_score", "method", "justification"}
+        assert expected <= SectionClassificationResult.model_fields.keys()
 
     @pytest.mark.asyncio
-    async def test_classification_result_structure(self, mock_section_repo):
+    async def test_classification_result_values(
+        self, stub_section_repo, classification_service, uid_factory
+    ):
         document = ParsedDocument(
-            template_version_id=uuid4(),
-            template_id=uuid4(),
+            template_version_id=uid_factory(),
+            template_id=uid_factory(),
             version_number=1,
             content_hash="test_hash",
             metadata=DocumentMetadata(),
@@ -226,94 +197,17 @@ class TestClassificationToPersistenceMapping:
                 ),
             ],
         )
-        service = create_classification_service(confidence_threshold=0.85)
-        result = await service.classify_template_sections(
+        result = await classification_service.classify_template_sections(
             parsed_document=document,
-            section_repo=mock_section_repo,
+            section_repo=stub_section_repo,
         )
         assert result.total_sections == 1
         classification = result.classifications[0]
-        assert hasattr(classification, "section_type")
         assert classification.section_type in ["STATIC", "DYNAMIC"]
-
-    @pytest.mark.asyncio
-    async def test_classification_includes_confidence(self, mock_section_repo):
-        document = ParsedDocument(
-            template_version_id=uuid4(),
-            template_id=uuid4(),
-            version_number=1,
-            content_hash="test_hash",
-            metadata=DocumentMetadata(),
-            blocks=[
-                ParagraphBlock(
-                    block_id="blk_par_0001_xyz",
-                    sequence=1,
-                    runs=[TextRun(text="Copyright 2024. All rights reserved.")],
-                ),
-            ],
-        )
-        service = create_classification_service(confidence_threshold=0.85)
-        result = await service.classify_template_sections(
-            parsed_document=document,
-            section_repo=mock_section_repo,
-        )
-        classification = result.classifications[0]
-        assert hasattr(classification, "confidence_score")
         assert 0.0 <= classification.confidence_score <= 1.0
-
-    @pytest.mark.asyncio
-    async def test_classification_includes_method(self, mock_section_repo):
-        document = ParsedDocument(
-            template_version_id=uuid4(),
-            template_id=uuid4(),
-            version_number=1,
-            content_hash="test_hash",
-            metadata=DocumentMetadata(),
-            blocks=[
-                ParagraphBlock(
-                    block_id="blk_par_0001_xyz",
-                    sequence=1,
-                    runs=[TextRun(text="This is confidential.")],
-                ),
-            ],
-        )
-        service = create_classification_service(
-            llm_config=None,
-            confidence_threshold=0.85,
-        )
-        result = await service.classify_template_sections(
-            parsed_document=document,
-            section_repo=mock_section_repo,
-        )
-        classification = result.classifications[0]
-        assert hasattr(classification, "method")
         assert classification.method in [
             ClassificationMethod.RULE_BASED,
             ClassificationMethod.LLM_ASSISTED,
             ClassificationMethod.FALLBACK,
         ]
-
-    @pytest.mark.asyncio
-    async def test_classification_includes_justification(self, mock_section_repo):
-        document = ParsedDocument(
-            template_version_id=uuid4(),
-            template_id=uuid4(),
-            version_number=1,
-            content_hash="test_hash",
-            metadata=DocumentMetadata(),
-            blocks=[
-                ParagraphBlock(
-                    block_id="blk_par_0001_xyz",
-                    sequence=1,
-                    runs=[TextRun(text="CONFIDENTIAL")],
-                ),
-            ],
-        )
-        service = create_classification_service(confidence_threshold=0.85)
-        result = await service.classify_template_sections(
-            parsed_document=document,
-            section_repo=mock_section_repo,
-        )
-        classification = result.classifications[0]
-        assert hasattr(classification, "justification")
-        assert classification.justification is not None
+        assert classification.justification
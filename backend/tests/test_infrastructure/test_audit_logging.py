@@ -7,23 +7,39 @@ Verifies:
 - Audit logs can be queried by entity
 """
 
-from datetime import datetime
-from uuid import uuid4
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
 
 import pytest
 
+from backend.app.domains.audit.models import AuditLog
+
+
+def _make_logs(
+    entity_type: str, actions: list[str], entity_id: Callable[[], UUID]
+) -> list[AuditLog]:
+    """Build one log per action, taking each log's entity ID from entity_id()."""
+    return [
+        AuditLog(
+            entity_type=entity_type,
+            entity_id=entity_id(),
+            action=action,
+            metadata_={},
+        )
+        for action in actions
+    ]
+
 
 class TestAuditLogRepository:
     """Tests for AuditRepository functionality."""
 
     @pytest.mark.asyncio
-    async def test_create_audit_log(self, audit_repository):
+    async def test_create_audit_log(self, audit_repository, uid_factory):
         """Should create an audit log entry."""
-        from backend.app.domains.audit.models import AuditLog
-
         log = AuditLog(
             entity_type="template",
-            entity_id=uuid4(),
+            entity_id=uid_factory(),
             action="created",
             metadata_={"name": "Test Template"},
         )
@@ -36,21 +52,21 @@ class TestAuditLogRepository:
         assert created.timestamp is not None
 
     @pytest.mark.asyncio
-    async def test_query_audit_logs_by_entity(self, audit_repository):
+    async def test_query_audit_logs_by_entity(self, audit_repository, uid_factory):
         """Should query audit logs for a specific entity."""
-        from backend.app.domains.audit.models import AuditLog
-
-        entity_id = uuid4()
+        entity_id = uid_factory()
 
         # Create multiple logs for same entity
-        for action in ["created", "updated", "published"]:
-            log = AuditLog(
+        logs = [
+            AuditLog(
                 entity_type="template",
                 entity_id=entity_id,
                 action=action,
                 metadata_={"action": action},
             )
-            await audit_repository.create(log)
+            for action in ["created", "updated", "published"]
+        ]
+        await audit_repository.create_batch(logs)
 
         logs = await audit_repository.query(entity_type="template", entity_id=entity_id)
 
@@ -59,30 +75,24 @@ class TestAuditLogRepository:
         assert actions == {"created", "updated", "published"}
 
     @pytest.mark.asyncio
-    async def test_query_audit_logs_all(self, audit_repository):
+    async def test_query_audit_logs_all(self, audit_repository, uid_factory):
         """Should query all audit logs with pagination."""
-        from backend.app.domains.audit.models import AuditLog
-
         # Create logs for different entities
-        for i in range(5):
-            log = AuditLog(
-                entity_type="job", entity_id=uuid4(), action=f"action_{i}", metadata_={"index": i}
-            )
-            await audit_repository.create(log)
+        await audit_repository.create_batch(
+            _make_logs("job", [f"action_{i}" for i in range(5)], uid_factory)
+        )
 
         logs = await audit_repository.query(limit=10)
 
         assert len(logs) >= 5
 
     @pytest.mark.asyncio
-    async def test_query_audit_logs_by_action(self, audit_repository):
+    async def test_query_audit_logs_by_action(self, audit_repository, uid_factory):
         """Should filter audit logs by action."""
-        from backend.app.domains.audit.models import AuditLog
-
         # Create logs with different actions
-        for action in ["created", "created", "updated"]:
-            log = AuditLog(entity_type="template", entity_id=uuid4(), action=action, metadata_={})
-            await audit_repository.create(log)
+        await audit_repository.create_batch(
+            _make_logs("template", ["created", "created", "updated"], uid_factory)
+        )
 
         created_logs = await audit_repository.query(action="created")
 
@@ -90,18 +100,14 @@ class TestAuditLogRepository:
         assert all(log.action == "created" for log in created_logs)
 
     @pytest.mark.asyncio
-    async def test_query_audit_logs_pagination(self, audit_repository):
+    async def test_query_audit_logs_pagination(self, audit_repository, uid_factory):
         """Should support pagination when querying audit logs."""
-        from backend.app.domains.audit.models import AuditLog
-
-        entity_id = uuid4()
+        entity_id = uid_factory()
 
         # Create 10 logs
-        for i in range(10):
-            log = AuditLog(
-                entity_type="section", entity_id=entity_id, action=f"action_{i}", metadata_={}
-            )
-            await audit_repository.create(log)
+        await audit_repository.create_batch(
+            _make_logs("section", [f"action_{i}" for i in range(10)], lambda: entity_id)
+        )
 
         # Get first page
         page1 = await audit_repository.query(
@@ -125,10 +131,8 @@ class TestAuditLogMetadata:
     """Tests for audit log metadata handling."""
 
     @pytest.mark.asyncio
-    async def test_audit_log_stores_metadata(self, audit_repository):
+    async def test_audit_log_stores_metadata(self, audit_repository, uid_factory):
         """Should store and retrieve metadata correctly."""
-        from backend.app.domains.audit.models import AuditLog
-
         metadata = {
             "old_status": "pending",
             "new_status": "completed",
@@ -137,7 +141,7 @@ class TestAuditLogMetadata:
         }
 
         log = AuditLog(
-            entity_type="job", entity_id=uuid4(), action="status_changed", metadata_=metadata
+            entity_type="job", entity_id=uid_factory(), action="status_changed", metadata_=metadata
         )
         created = await audit_repository.create(log)
 
@@ -148,11 +152,11 @@ class TestAuditLogMetadata:
         assert logs[0].metadata_ == metadata
 
     @pytest.mark.asyncio
-    async def test_audit_log_empty_metadata(self, audit_repository):
+    async def test_audit_log_empty_metadata(self, audit_repository, uid_factory):
         """Should handle empty metadata dict."""
-        from backend.app.domains.audit.models import AuditLog
-
-        log = AuditLog(entity_type="template", entity_id=uuid4(), action="deleted", metadata_={})
+        log = AuditLog(
+            entity_type="template", entity_id=uid_factory(), action="deleted", metadata_={}
+        )
 
         created = await audit_repository.create(log)
 
@@ -162,10 +166,8 @@ class TestAuditLogMetadata:
         assert logs[0].metadata_ == {}
 
     @pytest.mark.asyncio
-    async def test_audit_log_nested_metadata(self, audit_repository):
+    async def test_audit_log_nested_metadata(self, audit_repository, uid_factory):
         """Should handle nested metadata structures."""
-        from backend.app.domains.audit.models import AuditLog
-
         metadata = {
             "changes": {
                 "field1": {"old": "value1", "new": "value2"},
@@ -175,7 +177,7 @@ class TestAuditLogMetadata:
         }
 
         log = AuditLog(
-            entity_type="document", entity_id=uuid4(), action="updated", metadata_=metadata
+            entity_type="document", entity_id=uid_factory(), action="updated", metadata_=metadata
         )
 
         created = await audit_repository.create(log)
@@ -191,11 +193,11 @@ class TestAuditTrailCompleteness:
     """Tests for audit trail completeness requirements."""
 
     @pytest.mark.asyncio
-    async def test_audit_logs_have_timestamps(self, audit_repository):
+    async def test_audit_logs_have_timestamps(self, audit_repository, uid_factory):
         """All audit logs should have timestamp."""
-        from backend.app.domains.audit.models import AuditLog
-
-        log = AuditLog(entity_type="template", entity_id=uuid4(), action="created", metadata_={})
+        log = AuditLog(
+            entity_type="template", entity_id=uid_factory(), action="created", metadata_={}
+        )
 
         created = await audit_repository.create(log)
 
@@ -203,119 +205,61 @@ class TestAuditTrailCompleteness:
         assert isinstance(created.timestamp, datetime)
 
     @pytest.mark.asyncio
-    async def test_audit_logs_ordered_by_time(self, audit_repository):
+    async def test_audit_logs_ordered_by_time(self, audit_repository, uid_factory):
         """Audit logs should be retrievable in chronological order."""
-        import asyncio
+        entity_id = uid_factory()
+        base_time = datetime(2024, 1, 1, tzinfo=UTC)
 
-        from backend.app.domains.audit.models import AuditLog
-
-        entity_id = uuid4()
-
-        # Create logs with slight delays to ensure ordering
-        for i in range(3):
-            log = AuditLog(
+        # Explicit, increasing timestamps keep the ordering deterministic
+        logs = [
+            AuditLog(
                 entity_type="template",
                 entity_id=entity_id,
                 action=f"action_{i}",
                 metadata_={"order": i},
+                timestamp=base_time + timedelta(microseconds=i),
             )
-            await audit_repository.create(log)
-            await asyncio.sleep(0.01)  # Small delay
+            for i in range(3)
+        ]
+        await audit_repository.create_batch(logs)
 
         logs = await audit_repository.query(entity_type="template", entity_id=entity_id)
 
         # Should be ordered by timestamp (descending by default)
         assert len(logs) == 3
-
-
-class TestAuditLogEntityTypes:
-    """Tests for different entity types in audit logs."""
-
-    @pytest.mark.asyncio
-    async def test_template_audit_logs(self, audit_repository):
-        """Should handle template entity type."""
-        from backend.app.domains.audit.models import AuditLog
-
-        entity_id = uuid4()
-        log = AuditLog(
-            entity_type="template",
-            entity_id=entity_id,
-            action="created",
-            metadata_={"name": "Test Template"},
-        )
-        await audit_repository.create(log)
-
-        logs = await audit_repository.query(entity_type="template", entity_id=entity_id)
-        assert len(logs) == 1
-        assert logs[0].entity_type == "template"
-
+        assert [log.metadata_["order"] for log in logs] == [2, 1, 0]
+
+
+class TestAuditLogRoundTrip:
+    """Tests for common entity types and actions in audit logs."""
+
+    @pytest.mark.parametrize(
+        "entity_type,action,metadata",
+        [
+            ("template", "created", {"name": "Test Template"}),
+            ("job", "completed", {"job_type": "PARSE", "duration_ms": 1500}),
+            (
+                "template",
+                "updated",
+                {"field": "name", "old_value": "Old Name", "new_value": "New Name"},
+            ),
+            ("job", "status_changed", {"from_status": "PENDING", "to_status": "RUNNING"}),
+        ],
+        ids=["template_created", "job_completed", "template_updated", "job_status_changed"],
+    )
     @pytest.mark.asyncio
-    async def test_job_audit_logs(self, audit_repository):
-        """Should handle job entity type."""
-        from backend.app.domains.audit.models import AuditLog
-
-        entity_id = uuid4()
+    async def test_log_round_trip(
+        self, audit_repository, uid_factory, entity_type, action, metadata
+    ):
+        """Should store and query back the entity type, action and metadata."""
+        entity_id = uid_factory()
         log = AuditLog(
-            entity_type="job",
-            entity_id=entity_id,
-            action="completed",
-            metadata_={"job_type": "PARSE", "duration_ms": 1500},
+            entity_type=entity_type, entity_id=entity_id, action=action, metadata_=metadata
         )
         await audit_repository.create(log)
 
-        logs = await audit_repository.query(entity_type="job", entity_id=entity_id)
+        logs = await audit_repository.query(entity_type=entity_type, entity_id=entity_id)
         assert len(logs) == 1
-        assert logs[0].metadata_["job_type"] == "PARSE"
-
-
-class TestAuditLogActions:
-    """Tests for common audit log actions."""
-
-    @pytest.mark.asyncio
-    async def test_create_action(self, audit_repository):
-        """Should log entity creation."""
-        from backend.app.domains.audit.models import AuditLog
-
-        log = AuditLog(
-            entity_type="template",
-            entity_id=uuid4(),
-            action="created",
-            metadata_={"name": "New Template"},
-        )
-        created = await audit_repository.create(log)
-
-        assert created.action == "created"
-
-    @pytest.mark.asyncio
-    async def test_update_action(self, audit_repository):
-        """Should log entity updates with old/new values."""
-        from backend.app.domains.audit.models import AuditLog
-
-        log = AuditLog(
-            entity_type="template",
-            entity_id=uuid4(),
-            action="updated",
-            metadata_={"field": "name", "old_value": "Old Name", "new_value": "New Name"},
-        )
-        created = await audit_repository.create(log)
-
-        assert created.action == "updated"
-        assert created.metadata_["old_value"] == "Old Name"
-        assert created.metadata_["new_value"] == "New Name"
-
-    @pytest.mark.asyncio
-    async def test_status_change_action(self, audit_repository):
-        """Should log status changes."""
-        from backend.app.domains.audit.models import AuditLog
-
-        log = AuditLog(
-            entity_type="job",
-            entity_id=uuid4(),
-            action="status_changed",
-            metadata_={"from_status": "PENDING", "to_status": "RUNNING"},
-        )
-        created = await audit_repository.create(log)
-
-        assert created.action == "status_changed"
-        assert "from_status" in created.metadata_
-        assert "to_status" in created.metadata_
+        assert logs[0].entity_type == entity_type
+        assert logs[0].action == action
+        assert logs[0].metadata_ == metadata
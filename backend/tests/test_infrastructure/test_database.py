@@ -8,198 +8,201 @@ Verifies:
 - Migrations run cleanly
 """
 
+from dataclasses import dataclass
+from typing import Any
 from uuid import uuid4
 
 import pytest
 from sqlalchemy import inspect
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import IntegrityError
 
-
-class TestDatabaseSchema:
-    """Test database schema creation and structure."""
-
-    @pytest.mark.asyncio
-    async def test_all_tables_created(self, async_engine):
-        """All expected tables should be created."""
-        async with async_engine.connect() as conn:
-
-            def get_tables(connection):
-                inspector = inspect(connection)
-                return inspector.get_table_names()
-
-            tables = await conn.run_sync(get_tables)
-
-        expected_tables = [
-            "templates",
-            "template_versions",
-            "documents",
-            "document_versions",
-            "sections",
-            "jobs",
-            "audit_logs",
-        ]
-
-        for table in expected_tables:
-            assert table in tables, f"Table '{table}' not found in database"
-
-    @pytest.mark.asyncio
-    async def test_templates_table_columns(self, async_engine):
-        """Templates table should have correct columns."""
-        async with async_engine.connect() as conn:
-
-            def get_columns(connection):
-                inspector = inspect(connection)
-                return {c["name"]: c for c in inspector.get_columns("templates")}
-
-            columns = await conn.run_sync(get_columns)
-
-        assert "id" in columns
-        assert "name" in columns
-        assert "created_at" in columns
-        assert "updated_at" in columns
-
-    @pytest.mark.asyncio
-    async def test_template_versions_table_columns(self, async_engine):
-        """Template versions table should have correct columns."""
-        async with async_engine.connect() as conn:
-
-            def get_columns(connection):
-                inspector = inspect(connection)
-                return {c["name"]: c for c in inspector.get_columns("template_versions")}
-
-            columns = await conn.run_sync(get_columns)
-
-        expected_columns = [
-            "id",
-            "template_id",
-            "version_number",
-            "source_doc_path",
-            "parsed_representation_path",
-            "parsing_status",
-            "parsing_error",
-            "parsed_at",
-            "content_hash",
-            "created_at",
-        ]
-
-        for col in expected_columns:
-            assert col in columns, f"Column '{col}' not found in template_versions"
-
-    @pytest.mark.asyncio
-    async def test_jobs_table_columns(self, async_engine):
-        """Jobs table should have correct columns."""
+from backend.app.domains.document.models import Document, DocumentVersion
+from backend.app.domains.job.models import JobStatus, JobType
+from backend.app.domains.section.models import SectionType
+from backend.app.domains.template.models import ParsingStatus, Template, TemplateVersion
+from tests.conftest import TEST_DATABASE_URL
+
+# SQLite does not enforce foreign keys by default, so these checks only run
+# against PostgreSQL; decided at collection, before any fixture is set up.
+requires_fk_enforcement = pytest.mark.skipif(
+    make_url(TEST_DATABASE_URL).get_backend_name() == "sqlite",
+    reason="SQLite does not enforce foreign keys by default. Tested in PostgreSQL integration tests.",
+)
+
+SCHEMA_TABLES = (
+    "templates",
+    "template_versions",
+    "documents",
+    "document_versions",
+    "sections",
+    "jobs",
+    "audit_logs",
+)
+
+
+@dataclass(frozen=True)
+class SchemaSnapshot:
+    tables: list[str]
+    columns: dict[str, dict[str, dict[str, Any]]]
+
+
+def _collect_schema(connection) -> SchemaSnapshot:
+    inspector = inspect(connection)
+    tables = inspector.get_table_names()
+    wanted = [table for table in SCHEMA_TABLES if table in tables]
+    # One multi-table reflection where the dialect supports it, per-table otherwise.
+    try:
+        reflected = {
+            table: table_columns
+            for (_, table), table_columns in inspector.get_multi_columns(
+                filter_names=wanted
+            ).items()
+        }
+    except NotImplementedError:
+        reflected = {table: inspector.get_columns(table) for table in wanted}
+    columns = {
+        table: {c["name"]: c for c in table_columns} for table, table_columns in reflected.items()
+    }
+    return SchemaSnapshot(tables=tables, columns=columns)
+
+
+@pytest.fixture(scope="module")
+def schema_snapshot(async_engine, event_loop) -> SchemaSnapshot:
+    """Tables and columns reflected once, through one inspector, for the whole module."""
+
+    async def reflect() -> SchemaSnapshot:
         async with async_engine.connect() as conn:
+            return await conn.run_sync(_collect_schema)
 
-            def get_columns(connection):
-                inspector = inspect(connection)
-                return {c["name"]: c for c in inspector.get_columns("jobs")}
+    return event_loop.run_until_complete(reflect())
 
-            columns = await conn.run_sync(get_columns)
 
-        expected_columns = [
-            "id",
-            "job_type",
-            "status",
-            "payload",
-            "result",
-            "error",
-            "worker_id",
-            "started_at",
-            "completed_at",
-            "created_at",
-            "updated_at",
-        ]
+class TestDatabaseSchema:
+    """Test database schema creation and structure."""
 
-        for col in expected_columns:
-            assert col in columns, f"Column '{col}' not found in jobs"
+    @pytest.mark.parametrize("table", SCHEMA_TABLES)
+    def test_all_tables_created(self, schema_snapshot, table):
+        """All expected tables should be created."""
+        assert table in schema_snapshot.tables, f"Table '{table}' not found in database"
+
+    @pytest.mark.parametrize(
+        "table,expected_columns",
+        [
+            ("templates", ["id", "name", "created_at", "updated_at"]),
+            (
+                "template_versions",
+                [
+                    "id",
+                    "template_id",
+                    "version_number",
+                    "source_doc_path",
+                    "parsed_representation_path",
+                    "parsing_status",
+                    "parsing_error",
+                    "parsed_at",
+                    "content_hash",
+                    "created_at",
+                ],
+            ),
+            (
+                "jobs",
+                [
+                    "id",
+                    "job_type",
+                    "status",
+                    "payload",
+                    "result",
+                    "error",
+                    "worker_id",
+                    "started_at",
+                    "completed_at",
+                    "created_at",
+                    "updated_at",
+                ],
+            ),
+        ],
+    )
+    def test_table_columns(self, schema_snapshot, table, expected_columns):
+        """Core tables should have correct columns."""
+        missing = set(expected_columns) - schema_snapshot.columns[table].keys()
+        assert not missing, f"Columns {sorted(missing)} not found in {table}"
 
 
 class TestDatabaseConstraints:
     """Test database constraints and referential integrity."""
 
     @pytest.mark.asyncio
-    async def test_template_version_unique_constraint(self, db_session):
+    async def test_template_version_unique_constraint(self, db_session, uid_factory):
         """Template version number should be unique per template."""
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        # Create a template
-        template = Template(name="Test Template")
-        db_session.add(template)
-        await db_session.flush()
-
-        # Create first version
-        version1 = TemplateVersion(
-            template_id=template.id, version_number=1, source_doc_path="path/to/v1.docx"
+        # Create a template and its first version in a single flush
+        template_id = uid_factory()
+        db_session.add_all(
+            [
+                Template(id=template_id, name="Test Template"),
+                TemplateVersion(
+                    template_id=template_id, version_number=1, source_doc_path="path/to/v1.docx"
+                ),
+            ]
         )
-        db_session.add(version1)
         await db_session.flush()
 
         # Try to create duplicate version - should fail
-        version2 = TemplateVersion(
-            template_id=template.id,
-            version_number=1,  # Duplicate!
-            source_doc_path="path/to/v1_dup.docx",
-        )
-        db_session.add(version2)
-
         with pytest.raises(IntegrityError):
-            await db_session.flush()
+            async with db_session.begin_nested():
+                db_session.add(
+                    TemplateVersion(
+                        template_id=template_id,
+                        version_number=1,  # Duplicate!
+                        source_doc_path="path/to/v1_dup.docx",
+                    )
+                )
 
     @pytest.mark.asyncio
-    async def test_document_version_unique_constraint(self, db_session):
+    async def test_document_version_unique_constraint(self, db_session, uid_factory):
         """Document version number should be unique per document."""
-        from backend.app.domains.document.models import Document, DocumentVersion
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        # Create prerequisites
-        template = Template(name="Test Template")
-        db_session.add(template)
-        await db_session.flush()
-
-        version = TemplateVersion(
-            template_id=template.id, version_number=1, source_doc_path="path/to/v1.docx"
-        )
-        db_session.add(version)
-        await db_session.flush()
-
-        document = Document(template_version_id=version.id, current_version=0)
-        db_session.add(document)
-        await db_session.flush()
-
-        # Create first document version
-        doc_v1 = DocumentVersion(
-            document_id=document.id,
-            version_number=1,
-            output_doc_path="path/to/output1.docx",
-            generation_metadata={},
+        # Create prerequisites and the first document version in a single flush
+        template_id, version_id, document_id = uid_factory(), uid_factory(), uid_factory()
+        db_session.add_all(
+            [
+                Template(id=template_id, name="Test Template"),
+                TemplateVersion(
+                    id=version_id,
+                    template_id=template_id,
+                    version_number=1,
+                    source_doc_path="path/to/v1.docx",
+                ),
+                Document(id=document_id, template_version_id=version_id, current_version=0),
+                DocumentVersion(
+                    document_id=document_id,
+                    version_number=1,
+                    output_doc_path="path/to/output1.docx",
+                    generation_metadata={},
+                ),
+            ]
         )
-        db_session.add(doc_v1)
         await db_session.flush()
 
         # Try to create duplicate - should fail
-        doc_v1_dup = DocumentVersion(
-            document_id=document.id,
-            version_number=1,  # Duplicate!
-            output_doc_path="path/to/output1_dup.docx",
-            generation_metadata={},
-        )
-        db_session.add(doc_v1_dup)
-
         with pytest.raises(IntegrityError):
-            await db_session.flush()
+            async with db_session.begin_nested():
+                db_session.add(
+                    DocumentVersion(
+                        document_id=document_id,
+                        version_number=1,  # Duplicate!
+                        output_doc_path="path/to/output1_dup.docx",
+                        generation_metadata={},
+                    )
+                )
 
-    @pytest.mark.asyncio
-    @pytest.mark.skip(
-        reason="SQLite does not enforce foreign keys by default. Tested in PostgreSQL integration tests."
-    )
-    async def test_template_version_foreign_key(self, db_session):
-        """Template version should require valid template_id.
 
-        Note: This test is skipped because SQLite doesn't enforce foreign keys by default.
-        In production with PostgreSQL, foreign keys are enforced.
-        """
-        from backend.app.domains.template.models import TemplateVersion
+@requires_fk_enforcement
+class TestForeignKeyConstraints:
+    """Test foreign keys are enforced."""
 
+    @pytest.mark.asyncio
+    async def test_template_version_foreign_key(self, db_session):
+        """Template version should require valid template_id."""
         # Try to create version with non-existent template
         version = TemplateVersion(
             template_id=uuid4(),  # Non-existent template
@@ -212,17 +215,8 @@ class TestDatabaseConstraints:
             await db_session.flush()
 
     @pytest.mark.asyncio
-    @pytest.mark.skip(
-        reason="SQLite does not enforce foreign keys by default. Tested in PostgreSQL integration tests."
-    )
     async def test_document_foreign_key(self, db_session):
-        """Document should require valid template_version_id.
-
-        Note: This test is skipped because SQLite doesn't enforce foreign keys by default.
-        In production with PostgreSQL, foreign keys are enforced.
-        """
-        from backend.app.domains.document.models import Document
-
+        """Document should require valid template_version_id."""
         # Try to create document with non-existent template version
         document = Document(template_version_id=uuid4(), current_version=0)  # Non-existent version
         db_session.add(document)
@@ -236,16 +230,12 @@ class TestEnums:
 
     def test_job_type_enum_values(self):
         """JobType enum should have expected values."""
-        from backend.app.domains.job.models import JobType
-
         assert JobType.PARSE.value == "PARSE"
         assert JobType.CLASSIFY.value == "CLASSIFY"
         assert JobType.GENERATE.value == "GENERATE"
 
     def test_job_status_enum_values(self):
         """JobStatus enum should have expected values."""
-        from backend.app.domains.job.models import JobStatus
-
         assert JobStatus.PENDING.value == "PENDING"
         assert JobStatus.RUNNING.value == "RUNNING"
         assert JobStatus.COMPLETED.value == "COMPLETED"
@@ -253,8 +243,6 @@ class TestEnums:
 
     def test_parsing_status_enum_values(self):
         """ParsingStatus enum should have expected values."""
-        from backend.app.domains.template.models import ParsingStatus
-
         assert ParsingStatus.PENDING.value == "PENDING"
         assert ParsingStatus.IN_PROGRESS.value == "IN_PROGRESS"
         assert ParsingStatus.COMPLETED.value == "COMPLETED"
@@ -262,7 +250,5 @@ class TestEnums:
 
     def test_section_type_enum_values(self):
         """SectionType enum should have expected values."""
-        from backend.app.domains.section.models import SectionType
-
         assert SectionType.STATIC.value == "STATIC"
         assert SectionType.DYNAMIC.value == "DYNAMIC"
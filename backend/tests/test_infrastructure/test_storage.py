@@ -9,153 +9,144 @@ Verifies:
 - Path construction
 """
 
+from collections.abc import Callable
 from io import BytesIO
-from uuid import uuid4
+from uuid import UUID
 
+import pytest
 
-class TestTemplateStorage:
-    """Tests for template-related storage operations."""
+from tests.helpers.storage import MockStorageService
 
-    def test_upload_template_source(self, mock_storage):
-        """Should upload a template source and return the path."""
-        template_id = uuid4()
-        version = 1
-        content = b"Test DOCX content"
-        file_obj = BytesIO(content)
+TEST_CONTENT = b"Test content"
+# Binary content with every byte value
+ALL_BYTE_VALUES = bytes(range(256))
 
-        path = mock_storage.upload_template_source(template_id, version, file_obj)
 
-        assert path == f"templates/{template_id}/{version}/source.docx"
+@pytest.fixture(scope="module")
+def shared_storage() -> MockStorageService:
+    """One in-memory store built once per module; ``mock_storage`` wipes it before each test."""
+    return MockStorageService()
 
-    def test_get_template_source(self, mock_storage):
-        """Should retrieve template source content."""
-        template_id = uuid4()
-        version = 1
-        content = b"Test DOCX content"
-        file_obj = BytesIO(content)
 
-        mock_storage.upload_template_source(template_id, version, file_obj)
+@pytest.fixture
+def mock_storage(shared_storage: MockStorageService) -> MockStorageService:
+    """Override the per-test storage with the module's store, wiped before each test."""
+    shared_storage.clear()
+    return shared_storage
 
-        retrieved = mock_storage.get_template_source(template_id, version)
 
-        assert retrieved == content
+@pytest.fixture(scope="module")
+def sample_ids(uid_factory: Callable[[], UUID]) -> tuple[UUID, str]:
+    """An ID and its string form, generated once; the store is wiped between tests."""
+    uid = uid_factory()
+    return uid, str(uid)
 
-    def test_get_template_source_not_found(self, mock_storage):
-        """Should return None for non-existent template source."""
-        template_id = uuid4()
-        version = 999
 
-        result = mock_storage.get_template_source(template_id, version)
+@pytest.fixture(scope="module")
+def other_sample_ids(uid_factory: Callable[[], UUID]) -> tuple[UUID, str]:
+    """A second ID, distinct from ``sample_ids``, for isolation checks."""
+    uid = uid_factory()
+    return uid, str(uid)
 
-        assert result is None
 
-    def test_template_source_exists(self, mock_storage):
-        """Should check if template source exists."""
-        template_id = uuid4()
+# kind -> (upload, get, exists, path root, file name, payload)
+STORAGE_KINDS = {
+    "source": (
+        "upload_template_source",
+        "get_template_source",
+        "template_source_exists",
+        "templates",
+        "source.docx",
+        b"Test DOCX content",
+    ),
+    "parsed": (
+        "upload_template_parsed_json",
+        "get_template_parsed",
+        "template_parsed_exists",
+        "templates",
+        "parsed.json",
+        {
+            "sections": [{"id": "1", "type": "STATIC", "content": "Header"}],
+            "metadata": {"total_sections": 1},
+        },
+    ),
+    "output": (
+        "upload_document_output",
+        "get_document_output",
+        "document_output_exists",
+        "documents",
+        "output.docx",
+        b"Generated DOCX content",
+    ),
+}
+
+
+class TestStorageRoundTrip:
+    """Tests for upload, retrieval and existence of each stored kind."""
+
+    @pytest.mark.parametrize("kind", STORAGE_KINDS)
+    def test_upload_get_exists(self, mock_storage, uid_factory, kind):
+        """Upload should return the path, store the content, and mark it as existing."""
+        upload, get, exists, root, file_name, payload = STORAGE_KINDS[kind]
+        entity_id = uid_factory()
         version = 1
-        content = b"Test DOCX content"
-        file_obj = BytesIO(content)
 
         # Initially doesn't exist
-        assert mock_storage.template_source_exists(template_id, version) is False
-
-        # After upload, exists
-        mock_storage.upload_template_source(template_id, version, file_obj)
-        assert mock_storage.template_source_exists(template_id, version) is True
+        assert getattr(mock_storage, exists)(entity_id, version) is False
 
-    def test_upload_template_parsed(self, mock_storage):
-        """Should upload parsed template JSON and return the path."""
-        template_id = uuid4()
-        version = 1
-        content = b'{"sections": []}'
-        file_obj = BytesIO(content)
+        file_obj = BytesIO(payload) if isinstance(payload, bytes) else payload
+        path = getattr(mock_storage, upload)(entity_id, version, file_obj)
 
-        path = mock_storage.upload_template_parsed(template_id, version, file_obj)
+        assert path == f"{root}/{entity_id}/{version}/{file_name}"
+        assert getattr(mock_storage, get)(entity_id, version) == payload
+        assert getattr(mock_storage, exists)(entity_id, version) is True
 
-        assert path == f"templates/{template_id}/{version}/parsed.json"
 
-    def test_upload_template_parsed_json(self, mock_storage):
-        """Should upload parsed template from dict."""
-        template_id = uuid4()
-        version = 1
-        parsed_data = {
-            "sections": [{"id": "1", "type": "STATIC", "content": "Header"}],
-            "metadata": {"total_sections": 1},
-        }
+class TestTemplateStorage:
+    """Tests for template-related storage operations."""
 
-        path = mock_storage.upload_template_parsed_json(template_id, version, parsed_data)
+    def test_get_template_source_not_found(self, mock_storage, uid_factory):
+        """Should return None for non-existent template source."""
+        template_id = uid_factory()
+        version = 999
 
-        assert path == f"templates/{template_id}/{version}/parsed.json"
+        result = mock_storage.get_template_source(template_id, version)
 
-        # Verify we can retrieve it
-        retrieved = mock_storage.get_template_parsed(template_id, version)
-        assert retrieved == parsed_data
+        assert result is None
 
-    def test_get_template_parsed(self, mock_storage):
-        """Should retrieve parsed template as dict."""
-        template_id = uuid4()
+    def test_upload_template_parsed(self, mock_storage, uid_factory):
+        """Should upload parsed template JSON and return the path."""
+        template_id = uid_factory()
         version = 1
-        parsed_data = {"sections": [], "version": "1.0"}
-
-        mock_storage.upload_template_parsed_json(template_id, version, parsed_data)
+        content = b'{"sections": []}'
+        file_obj = BytesIO(content)
 
-        retrieved = mock_storage.get_template_parsed(template_id, version)
+        path = mock_storage.upload_template_parsed(template_id, version, file_obj)
 
-        assert retrieved == parsed_data
+        assert path == f"templates/{template_id}/{version}/parsed.json"
 
-    def test_get_template_parsed_not_found(self, mock_storage):
+    def test_get_template_parsed_not_found(self, mock_storage, uid_factory):
         """Should return None for non-existent parsed template."""
-        template_id = uuid4()
+        template_id = uid_factory()
         version = 999
 
         result = mock_storage.get_template_parsed(template_id, version)
 
         assert result is None
 
-    def test_template_parsed_exists(self, mock_storage):
-        """Should check if parsed template exists."""
-        template_id = uuid4()
-        version = 1
-
-        # Initially doesn't exist
-        assert mock_storage.template_parsed_exists(template_id, version) is False
-
-        # After upload, exists
-        mock_storage.upload_template_parsed_json(template_id, version, {"sections": []})
-        assert mock_storage.template_parsed_exists(template_id, version) is True
-
-
-class TestDocumentStorage:
-    """Tests for document-related storage operations."""
-
-    def test_upload_document_output(self, mock_storage):
-        """Should upload document output and return the path."""
-        document_id = uuid4()
-        version = 1
-        content = b"Generated DOCX content"
-        file_obj = BytesIO(content)
-
-        path = mock_storage.upload_document_output(document_id, version, file_obj)
-
-        assert path == f"documents/{document_id}/{version}/output.docx"
-
 
 class TestGenericStorageOperations:
     """Tests for generic file operations."""
 
-    def test_get_file(self, mock_storage):
+    def test_get_file(self, mock_storage, uid_factory):
         """Should retrieve file by key."""
-        template_id = uuid4()
+        template_id = uid_factory()
         version = 1
-        content = b"Test content"
-        file_obj = BytesIO(content)
-
-        mock_storage.upload_template_source(template_id, version, file_obj)
-        key = f"templates/{template_id}/{version}/source.docx"
+        key = mock_storage.upload_template_source(template_id, version, BytesIO(TEST_CONTENT))
 
         retrieved = mock_storage.get_file(key)
 
-        assert retrieved == content
+        assert retrieved == TEST_CONTENT
 
     def test_get_file_not_found(self, mock_storage):
         """Should return None for non-existent key."""
@@ -163,28 +154,20 @@ class TestGenericStorageOperations:
 
         assert result is None
 
-    def test_file_exists(self, mock_storage):
+    def test_file_exists(self, mock_storage, uid_factory):
         """Should check if file exists by key."""
-        template_id = uuid4()
+        template_id = uid_factory()
         version = 1
-        content = b"Test content"
-        file_obj = BytesIO(content)
-
-        mock_storage.upload_template_source(template_id, version, file_obj)
-        key = f"templates/{template_id}/{version}/source.docx"
+        key = mock_storage.upload_template_source(template_id, version, BytesIO(TEST_CONTENT))
 
         assert mock_storage.file_exists(key) is True
         assert mock_storage.file_exists("nonexistent/path") is False
 
-    def test_delete_file(self, mock_storage):
+    def test_delete_file(self, mock_storage, uid_factory):
         """Should delete a file by key."""
-        template_id = uuid4()
+        template_id = uid_factory()
         version = 1
-        content = b"Test content"
-        file_obj = BytesIO(content)
-
-        mock_storage.upload_template_source(template_id, version, file_obj)
-        key = f"templates/{template_id}/{version}/source.docx"
+        key = mock_storage.upload_template_source(template_id, version, BytesIO(TEST_CONTENT))
 
         # Verify it exists
         assert mock_storage.file_exists(key) is True
@@ -205,52 +188,32 @@ class TestGenericStorageOperations:
 class TestStoragePathPatterns:
     """Tests for storage path patterns and conventions."""
 
-    def test_template_source_path_pattern(self, mock_storage):
-        """Template source paths should follow pattern: templates/{id}/{version}/source.docx"""
-        template_id = uuid4()
-        version = 1
-
-        path = mock_storage.upload_template_source(template_id, version, BytesIO(b"content"))
-
-        parts = path.split("/")
-        assert parts[0] == "templates"
-        assert parts[1] == str(template_id)
-        assert parts[2] == str(version)
-        assert parts[3] == "source.docx"
-
-    def test_template_parsed_path_pattern(self, mock_storage):
-        """Template parsed paths should follow pattern: templates/{id}/{version}/parsed.json"""
-        template_id = uuid4()
-        version = 1
-
-        path = mock_storage.upload_template_parsed_json(template_id, version, {"sections": []})
-
-        parts = path.split("/")
-        assert parts[0] == "templates"
-        assert parts[1] == str(template_id)
-        assert parts[2] == str(version)
-        assert parts[3] == "parsed.json"
-
-    def test_document_output_path_pattern(self, mock_storage):
-        """Document output paths should follow pattern: documents/{id}/{version}/output.docx"""
-        document_id = uuid4()
+    @pytest.mark.parametrize(
+        "method,payload,prefix,suffix",
+        [
+            ("upload_template_source", b"content", "templates", "source.docx"),
+            ("upload_template_parsed_json", {"sections": []}, "templates", "parsed.json"),
+            ("upload_document_output", b"content", "documents", "output.docx"),
+        ],
+    )
+    def test_path_pattern(self, mock_storage, sample_ids, method, payload, prefix, suffix):
+        """Paths should follow pattern: {templates|documents}/{id}/{version}/{file}"""
+        entity_id, entity_id_str = sample_ids
         version = 1
+        if isinstance(payload, bytes):
+            payload = BytesIO(payload)
 
-        path = mock_storage.upload_document_output(document_id, version, BytesIO(b"content"))
+        path = getattr(mock_storage, method)(entity_id, version, payload)
 
-        parts = path.split("/")
-        assert parts[0] == "documents"
-        assert parts[1] == str(document_id)
-        assert parts[2] == str(version)
-        assert parts[3] == "output.docx"
+        assert path.split("/") == [prefix, entity_id_str, str(version), suffix]
 
 
 class TestStorageVersioning:
     """Tests for storage versioning behavior."""
 
-    def test_multiple_versions_stored_separately(self, mock_storage):
+    def test_multiple_versions_stored_separately(self, mock_storage, uid_factory):
         """Different versions should be stored at different paths."""
-        template_id = uuid4()
+        template_id = uid_factory()
 
         # Upload version 1
         mock_storage.upload_template_source(template_id, 1, BytesIO(b"Version 1 content"))
@@ -265,9 +228,9 @@ class TestStorageVersioning:
         assert v1 == b"Version 1 content"
         assert v2 == b"Version 2 content"
 
-    def test_overwrite_same_version(self, mock_storage):
+    def test_overwrite_same_version(self, mock_storage, uid_factory):
         """Uploading to same version should overwrite."""
-        template_id = uuid4()
+        template_id = uid_factory()
         version = 1
 
         # Upload initial content
@@ -284,23 +247,19 @@ class TestStorageVersioning:
 class TestStorageFileFormats:
     """Tests for handling different file formats."""
 
-    def test_upload_binary_content(self, mock_storage):
+    def test_upload_binary_content(self, mock_storage, uid_factory):
         """Should handle binary content correctly."""
-        template_id = uuid4()
+        template_id = uid_factory()
         version = 1
 
-        # Binary content with various byte values
-        binary_content = bytes(range(256))
-        file_obj = BytesIO(binary_content)
-
-        mock_storage.upload_template_source(template_id, version, file_obj)
+        mock_storage.upload_template_source(template_id, version, BytesIO(ALL_BYTE_VALUES))
 
         retrieved = mock_storage.get_template_source(template_id, version)
-        assert retrieved == binary_content
+        assert retrieved == ALL_BYTE_VALUES
 
-    def test_upload_json_preserves_structure(self, mock_storage):
+    def test_upload_json_preserves_structure(self, mock_storage, uid_factory):
         """Should preserve JSON structure when uploading parsed data."""
-        template_id = uuid4()
+        template_id = uid_factory()
         version = 1
 
         complex_data = {
@@ -324,10 +283,10 @@ class TestStorageFileFormats:
 class TestStorageIsolation:
     """Tests for storage isolation between entities."""
 
-    def test_templates_isolated_by_id(self, mock_storage):
+    def test_templates_isolated_by_id(self, mock_storage, sample_ids, other_sample_ids):
         """Templates with different IDs should be isolated."""
-        template_id_1 = uuid4()
-        template_id_2 = uuid4()
+        template_id_1, _ = sample_ids
+        template_id_2, _ = other_sample_ids
         version = 1
 
         mock_storage.upload_template_source(template_id_1, version, BytesIO(b"Template 1"))
@@ -339,9 +298,9 @@ class TestStorageIsolation:
         assert content_1 == b"Template 1"
         assert content_2 == b"Template 2"
 
-    def test_source_and_parsed_isolated(self, mock_storage):
+    def test_source_and_parsed_isolated(self, mock_storage, sample_ids):
         """Source and parsed files should be stored separately."""
-        template_id = uuid4()
+        template_id, _ = sample_ids
         version = 1
 
         mock_storage.upload_template_source(template_id, version, BytesIO(b"Source content"))
@@ -0,0 +1,44 @@
+from collections.abc import AsyncGenerator
+
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.app.domains.template.models import TemplateVersion
+from backend.app.infrastructure.database import Base
+
+
+@pytest_asyncio.fixture
+async def parse_version(make_template_version) -> TemplateVersion:
+    """A persisted template version for job payloads to reference."""
+    return await make_template_version()
+
+
+@pytest_asyncio.fixture
+async def worker_sessions(tmp_path) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    """Session factory on a file database where every session gets its own connection.
+
+    The shared in-memory engine funnels all sessions through one connection,
+    so it cannot show two workers racing for the same row.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+
+    # Take the write lock at BEGIN so competing writers wait on the busy
+    # timeout instead of failing on a lock upgrade. The file is thrown away
+    # after the test, so skip the on-disk journal and fsyncs.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
@@ -8,54 +8,33 @@ Verifies:
 - Job result storage
 """
 
+import asyncio
+from datetime import timedelta
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
+
+from backend.app.domains.job.models import Job, JobStatus, JobType
+from backend.app.domains.job.repository import JobRepository
+from backend.app.infrastructure.datetime_utils import utc_now
+from backend.app.worker.handlers import get_handler_for_job_type
 
 
 class TestJobLifecycle:
     """Tests for job lifecycle management."""
 
-    @pytest.mark.asyncio
-    async def test_job_created_with_pending_status(self, job_repository, template_repository):
+    async def test_job_created_with_pending_status(self, job_repository, parse_version):
         """Jobs should start with PENDING status."""
-        from backend.app.domains.job.models import Job, JobStatus, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        # Create prerequisites
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
-
         # Create job
-        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
+        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(parse_version.id)})
         created = await job_repository.create(job)
 
         assert created.status == JobStatus.PENDING
 
-    @pytest.mark.asyncio
-    async def test_job_transition_to_running(self, job_repository, template_repository):
+    async def test_job_transition_to_running(self, job_repository, parse_version):
         """Job should transition from PENDING to RUNNING when claimed."""
-        from backend.app.domains.job.models import Job, JobStatus, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
-
-        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
+        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(parse_version.id)})
         await job_repository.create(job)
 
         # Claim the job
@@ -66,23 +45,9 @@ class TestJobLifecycle:
         assert claimed.worker_id == "worker-1"
         assert claimed.started_at is not None
 
-    @pytest.mark.asyncio
-    async def test_job_transition_to_completed(self, job_repository, template_repository):
+    async def test_job_transition_to_completed(self, job_repository, parse_version):
         """Job should transition from RUNNING to COMPLETED."""
-        from backend.app.domains.job.models import Job, JobStatus, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
-
-        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
+        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(parse_version.id)})
         await job_repository.create(job)
 
         # Claim and complete
@@ -93,23 +58,9 @@ class TestJobLifecycle:
         assert completed.completed_at is not None
         assert completed.result == {"sections_parsed": 5}
 
-    @pytest.mark.asyncio
-    async def test_job_transition_to_failed(self, job_repository, template_repository):
+    async def test_job_transition_to_failed(self, job_repository, parse_version):
         """Job should transition from RUNNING to FAILED with error message."""
-        from backend.app.domains.job.models import Job, JobStatus, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
-
-        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
+        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(parse_version.id)})
         await job_repository.create(job)
 
         # Claim and fail
@@ -122,37 +73,74 @@ class TestJobLifecycle:
         assert failed.completed_at is not None
         assert failed.error == "Document parsing failed: invalid format"
 
+    async def test_batch_complete_updates_all_jobs(self, job_repository, parse_version):
+        """A batch completion should finish every running job with its own result."""
+        await job_repository.create_batch(
+            [
+                Job(job_type=JobType.PARSE, payload={"template_version_id": str(parse_version.id)})
+                for _ in range(3)
+            ]
+        )
+        running = await job_repository.claim_pending_jobs_batch("worker-1", limit=2)
+        results = {job.id: {"sections_parsed": i} for i, job in enumerate(running)}
 
-class TestJobClaiming:
-    """Tests for job claiming mechanism."""
+        completed = await job_repository.complete_jobs_batch(results)
 
-    @pytest.mark.asyncio
-    async def test_claim_returns_oldest_pending_job(self, job_repository, template_repository):
-        """Should claim the oldest pending job first."""
-        import asyncio
+        assert {job.id for job in completed} == set(results)
+        for job in completed:
+            assert job.status == JobStatus.COMPLETED
+            assert job.completed_at is not None
+            assert job.result == results[job.id]
 
-        from backend.app.domains.job.models import Job, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
+    async def test_batch_complete_skips_jobs_not_running(self, job_repository, parse_version):
+        """A batch completion should leave pending jobs untouched."""
+        job = await job_repository.create(
+            Job(job_type=JobType.PARSE, payload={"template_version_id": str(parse_version.id)})
+        )
+
+        completed = await job_repository.complete_jobs_batch({job.id: None})
 
-        template = Template(name="Test Template")
-        await template_repository.create(template)
+        assert completed == []
+        assert job.status == JobStatus.PENDING
 
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
+    async def test_batch_fail_preserves_individual_errors(self, job_repository, parse_version):
+        """A batch failure should record each job's own error message."""
+        jobs = await job_repository.create_batch(
+            [
+                Job(job_type=JobType.PARSE, payload={"template_version_id": str(parse_version.id)})
+                for _ in range(2)
+            ]
         )
-        await template_repository.create_version(version)
+        await job_repository.claim_pending_job("worker-1")
+        errors = {job.id: f"Document parsing failed: {i}" for i, job in enumerate(jobs)}
 
-        # Create jobs with slight delay to ensure ordering
-        job_ids = []
-        for i in range(3):
-            job = Job(
-                job_type=JobType.PARSE, payload={"template_version_id": str(version.id), "order": i}
-            )
-            created = await job_repository.create(job)
-            job_ids.append(created.id)
-            await asyncio.sleep(0.01)
+        failed = await job_repository.fail_jobs_batch(errors)
+
+        assert {job.id for job in failed} == set(errors)
+        for job in failed:
+            assert job.status == JobStatus.FAILED
+            assert job.completed_at is not None
+            assert job.error == errors[job.id]
+
+
+class TestJobClaiming:
+    """Tests for job claiming mechanism."""
+
+    async def test_claim_returns_oldest_pending_job(self, job_repository, parse_version):
+        """Should claim the oldest pending job first."""
+        # Create jobs with explicit, increasing creation times
+        base_time = utc_now()
+        jobs = await job_repository.create_batch(
+            [
+                Job(
+                    job_type=JobType.PARSE,
+                    payload={"template_version_id": str(parse_version.id), "order": i},
+                    created_at=base_time + timedelta(microseconds=i),
+                )
+                for i in range(3)
+            ]
+        )
+        job_ids = [job.id for job in jobs]
 
         # Claim should return the first job
         claimed = await job_repository.claim_pending_job("worker-1")
@@ -160,31 +148,16 @@ class TestJobClaiming:
         assert claimed is not None
         assert claimed.id == job_ids[0]
 
-    @pytest.mark.asyncio
     async def test_claim_returns_none_when_no_pending_jobs(self, job_repository):
         """Should return None when no pending jobs exist."""
         claimed = await job_repository.claim_pending_job("worker-1")
 
         assert claimed is None
 
-    @pytest.mark.asyncio
-    async def test_claimed_job_not_claimable_again(self, job_repository, template_repository):
+    async def test_claimed_job_not_claimable_again(self, job_repository, parse_version):
         """A claimed job should not be claimable by another worker."""
-        from backend.app.domains.job.models import Job, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
-
         # Create single job
-        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
+        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(parse_version.id)})
         await job_repository.create(job)
 
         # First worker claims
@@ -195,100 +168,140 @@ class TestJobClaiming:
         claimed2 = await job_repository.claim_pending_job("worker-2")
         assert claimed2 is None
 
+    async def test_concurrent_claim_is_race_free(self, worker_sessions):
+        """Concurrent workers should never be handed the same job."""
+        payload = {"template_version_id": str(uuid4())}
+        async with worker_sessions.begin() as session:
+            await JobRepository(session).create_batch(
+                [Job(job_type=JobType.PARSE, payload=payload) for _ in range(5)]
+            )
 
-class TestJobTypeHandling:
-    """Tests for different job types."""
-
-    @pytest.mark.asyncio
-    async def test_parse_job_type(self, job_repository, template_repository):
-        """Should handle PARSE job type."""
-        from backend.app.domains.job.models import Job, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
+        async def claim(worker_id: str):
+            async with worker_sessions.begin() as session:
+                return await JobRepository(session).claim_pending_job(worker_id)
+
+        results = await asyncio.gather(*(claim(f"worker-{i}") for i in range(20)))
+
+        claimed = [job for job in results if job is not None]
+        assert len(claimed) == 5
+        assert len({job.id for job in claimed}) == 5
+        assert len({job.worker_id for job in claimed}) == 5
+
+    @pytest.mark.parametrize("limit", [1, 10])
+    def test_claim_skips_locked_rows_on_postgres(self, job_repository, limit):
+        """Workers should pass over rows another worker holds instead of queueing on them."""
+        statement = job_repository._claim_statement("worker-1", None, limit)
+
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert "FOR UPDATE SKIP LOCKED" in sql
+
+    async def test_claim_filters_by_job_type(self, job_repository, parse_version):
+        """Should only claim pending jobs of the requested types."""
+        base_time = utc_now()
+        parse_job, classify_job = await job_repository.create_batch(
+            [
+                Job(
+                    job_type=job_type,
+                    payload={"template_version_id": str(parse_version.id)},
+                    created_at=base_time + timedelta(microseconds=i),
+                )
+                for i, job_type in enumerate([JobType.PARSE, JobType.CLASSIFY])
+            ]
         )
-        await template_repository.create_version(version)
-
-        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
-        created = await job_repository.create(job)
-
-        assert created.job_type == JobType.PARSE
 
-    @pytest.mark.asyncio
-    async def test_classify_job_type(self, job_repository, template_repository):
-        """Should handle CLASSIFY job type."""
-        from backend.app.domains.job.models import Job, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
+        claimed = await job_repository.claim_pending_job("worker-1", [JobType.CLASSIFY])
 
-        template = Template(name="Test Template")
-        await template_repository.create(template)
+        assert claimed is not None
+        assert claimed.id == classify_job.id
+        assert parse_job.status == JobStatus.PENDING
+
+    async def test_batch_claim_returns_up_to_limit(self, job_repository, parse_version):
+        """A batch claim should take at most `limit` jobs and leave the rest pending."""
+        await job_repository.create_batch(
+            [
+                Job(job_type=JobType.PARSE, payload={"template_version_id": str(parse_version.id)})
+                for _ in range(3)
+            ]
+        )
 
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
+        claimed = await job_repository.claim_pending_jobs_batch("worker-1", limit=2)
+
+        assert len(claimed) == 2
+        assert all(job.status == JobStatus.RUNNING for job in claimed)
+        assert all(job.worker_id == "worker-1" for job in claimed)
+        assert len(await job_repository.list_all(status_filter=JobStatus.PENDING)) == 1
+        assert len(await job_repository.claim_pending_jobs_batch("worker-2", limit=2)) == 1
+
+    @pytest.mark.parametrize("limit", [0, -1])
+    async def test_batch_claim_rejects_non_positive_limit(
+        self, job_repository, parse_version, limit
+    ):
+        """A batch claim with no positive limit should fail without claiming anything."""
+        await job_repository.create(
+            Job(job_type=JobType.PARSE, payload={"template_version_id": str(parse_version.id)})
         )
-        await template_repository.create_version(version)
 
-        job = Job(job_type=JobType.CLASSIFY, payload={"template_version_id": str(version.id)})
-        created = await job_repository.create(job)
+        with pytest.raises(ValueError):
+            await job_repository.claim_pending_jobs_batch("worker-1", limit=limit)
+
+        assert len(await job_repository.list_all(status_filter=JobStatus.PENDING)) == 1
+
+    async def test_batch_claim_respects_fifo_across_batch(self, job_repository, parse_version):
+        """A batch claim should take the oldest pending jobs, returned oldest first."""
+        base_time = utc_now()
+        jobs = await job_repository.create_batch(
+            [
+                Job(
+                    job_type=JobType.PARSE,
+                    payload={"template_version_id": str(parse_version.id), "order": i},
+                    created_at=base_time - timedelta(microseconds=i),
+                )
+                for i in range(4)
+            ]
+        )
 
-        assert created.job_type == JobType.CLASSIFY
+        claimed = await job_repository.claim_pending_jobs_batch("worker-1", limit=2)
 
-    @pytest.mark.asyncio
-    async def test_generate_job_type(self, job_repository, template_repository):
-        """Should handle GENERATE job type."""
-        from backend.app.domains.job.models import Job, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
+        assert [job.id for job in claimed] == [jobs[3].id, jobs[2].id]
 
-        template = Template(name="Test Template")
-        await template_repository.create(template)
 
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
+class TestJobTypeHandling:
+    """Tests for different job types."""
 
+    @pytest.mark.parametrize(
+        "job_type,extra_payload",
+        [
+            (JobType.PARSE, {}),
+            (JobType.CLASSIFY, {}),
+            (JobType.GENERATE, {"document_id": str(uuid4())}),
+        ],
+    )
+    async def test_job_type_round_trip(
+        self, job_repository, parse_version, job_type, extra_payload
+    ):
+        """Should handle each job type."""
         job = Job(
-            job_type=JobType.GENERATE,
-            payload={"template_version_id": str(version.id), "document_id": str(uuid4())},
+            job_type=job_type,
+            payload={"template_version_id": str(parse_version.id), **extra_payload},
         )
         created = await job_repository.create(job)
 
-        assert created.job_type == JobType.GENERATE
+        assert created.job_type == job_type
 
 
 class TestJobFiltering:
     """Tests for job listing and filtering."""
 
-    @pytest.mark.asyncio
-    async def test_list_jobs_by_status(self, job_repository, template_repository):
+    async def test_list_jobs_by_status(self, job_repository, parse_version):
         """Should filter jobs by status."""
-        from backend.app.domains.job.models import Job, JobStatus, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
-
         # Create jobs
-        for _ in range(3):
-            job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
-            await job_repository.create(job)
+        await job_repository.create_batch(
+            [
+                Job(job_type=JobType.PARSE, payload={"template_version_id": str(parse_version.id)})
+                for _ in range(3)
+            ]
+        )
 
         # Claim one job to make it RUNNING
         await job_repository.claim_pending_job("worker-1")
@@ -301,26 +314,15 @@ class TestJobFiltering:
         running_jobs = await job_repository.list_all(status_filter=JobStatus.RUNNING)
         assert len(running_jobs) == 1
 
-    @pytest.mark.asyncio
-    async def test_list_jobs_by_type(self, job_repository, template_repository):
+    async def test_list_jobs_by_type(self, job_repository, parse_version):
         """Should filter jobs by job type."""
-        from backend.app.domains.job.models import Job, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
-
         # Create different job types
-        for job_type in [JobType.PARSE, JobType.PARSE, JobType.CLASSIFY]:
-            job = Job(job_type=job_type, payload={"template_version_id": str(version.id)})
-            await job_repository.create(job)
+        await job_repository.create_batch(
+            [
+                Job(job_type=job_type, payload={"template_version_id": str(parse_version.id)})
+                for job_type in [JobType.PARSE, JobType.PARSE, JobType.CLASSIFY]
+            ]
+        )
 
         parse_jobs = await job_repository.list_all(job_type=JobType.PARSE)
         classify_jobs = await job_repository.list_all(job_type=JobType.CLASSIFY)
@@ -332,24 +334,10 @@ class TestJobFiltering:
 class TestJobPayload:
     """Tests for job payload handling."""
 
-    @pytest.mark.asyncio
-    async def test_job_payload_stored_correctly(self, job_repository, template_repository):
+    async def test_job_payload_stored_correctly(self, job_repository, parse_version):
         """Job payload should be stored and retrieved correctly."""
-        from backend.app.domains.job.models import Job, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
-
         payload = {
-            "template_version_id": str(version.id),
+            "template_version_id": str(parse_version.id),
             "options": {"llm_enabled": True, "confidence_threshold": 0.85},
         }
 
@@ -359,25 +347,10 @@ class TestJobPayload:
         retrieved = await job_repository.get_by_id(created.id)
 
         assert retrieved.payload == payload
-        assert retrieved.payload["options"]["llm_enabled"] is True
 
-    @pytest.mark.asyncio
-    async def test_job_result_stored_correctly(self, job_repository, template_repository):
+    async def test_job_result_stored_correctly(self, job_repository, parse_version):
         """Job result should be stored correctly on completion."""
-        from backend.app.domains.job.models import Job, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
-
-        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
+        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(parse_version.id)})
         await job_repository.create(job)
 
         claimed = await job_repository.claim_pending_job("worker-1")
@@ -391,45 +364,28 @@ class TestJobPayload:
         completed = await job_repository.complete_job(claimed.id, result=result)
 
         assert completed.result == result
-        assert completed.result["section_types"]["STATIC"] == 7
 
 
 class TestJobHandlers:
     """Tests for job handler registration."""
 
-    def test_parse_handler_registered(self):
-        """PARSE handler should be registered."""
-        from backend.app.domains.job.models import JobType
-        from backend.app.worker.handlers import get_handler_for_job_type
-
-        handler = get_handler_for_job_type(JobType.PARSE)
-
-        assert handler is not None
-        assert handler.name == "ParsingHandler"
-
-    def test_classify_handler_registered(self):
-        """CLASSIFY handler should be registered."""
-        from backend.app.domains.job.models import JobType
-        from backend.app.worker.handlers import get_handler_for_job_type
-
-        handler = get_handler_for_job_type(JobType.CLASSIFY)
+    @pytest.mark.smoke
+    @pytest.mark.parametrize(
+        "job_type,expected_name",
+        [
+            (JobType.PARSE, "ParsingHandler"),
+            (JobType.CLASSIFY, "ClassificationHandler"),
+            (JobType.GENERATE, "GenerationPipelineHandler"),
+        ],
+    )
+    def test_handler_registered(self, job_type, expected_name):
+        """Each job type should have its handler registered."""
+        handler = get_handler_for_job_type(job_type)
 
         assert handler is not None
-        assert handler.name == "ClassificationHandler"
-
-    def test_generate_handler_registered(self):
-        """GENERATE handler should be registered."""
-        from backend.app.domains.job.models import JobType
-        from backend.app.worker.handlers import get_handler_for_job_type
-
-        handler = get_handler_for_job_type(JobType.GENERATE)
-
-        assert handler is not None
-        assert handler.name == "GenerationPipelineHandler"
+        assert handler.name == expected_name
 
     def test_unknown_job_type_raises_error(self):
         """Unknown job type should raise ValueError."""
-        from backend.app.worker.handlers import get_handler_for_job_type
-
         with pytest.raises(ValueError, match="No handler registered"):
             get_handler_for_job_type("UNKNOWN_TYPE")
@@ -7,24 +7,25 @@ Verifies:
 - Querying by action type
 """
 
+import json
+from datetime import timedelta
+
 import pytest
 
+from backend.app.domains.audit.models import AuditLog
+from backend.app.infrastructure.datetime_utils import utc_now
+from tests.helpers.query_plan import query_plan, uses_index_without_sort
+
 
 class TestAuditRepository:
     """Tests for AuditRepository."""
 
     @pytest.mark.asyncio
-    async def test_create_audit_log(self, audit_repository, template_repository):
+    async def test_create_audit_log(self, audit_repository, seed_template):
         """Should create an audit log entry."""
-        from backend.app.domains.audit.models import AuditLog
-        from backend.app.domains.template.models import Template
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
         log = AuditLog(
             entity_type="template",
-            entity_id=template.id,
+            entity_id=seed_template.id,
             action="created",
             metadata_={"name": "Test Template"},
         )
@@ -36,83 +37,64 @@ class TestAuditRepository:
         assert created.timestamp is not None
 
     @pytest.mark.asyncio
-    async def test_query_by_entity(self, audit_repository, template_repository):
+    async def test_query_by_entity(self, audit_repository, seed_template):
         """Should query audit logs for a specific entity."""
-        from backend.app.domains.audit.models import AuditLog
-        from backend.app.domains.template.models import Template
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
         # Create multiple logs for same entity
         actions = ["created", "updated", "parsed"]
-        for action in actions:
-            log = AuditLog(
-                entity_type="template", entity_id=template.id, action=action, metadata_={}
-            )
-            await audit_repository.create(log)
+        await audit_repository.create_batch(
+            [
+                AuditLog(
+                    entity_type="template", entity_id=seed_template.id, action=action, metadata_={}
+                )
+                for action in actions
+            ]
+        )
 
-        logs = await audit_repository.query(entity_type="template", entity_id=template.id)
+        logs = await audit_repository.query(entity_type="template", entity_id=seed_template.id)
 
         assert len(logs) == 3
 
     @pytest.mark.asyncio
-    async def test_query_by_action(self, audit_repository, template_repository):
+    async def test_query_by_action(self, audit_repository, uid_factory):
         """Should query audit logs by action type."""
-        from backend.app.domains.audit.models import AuditLog
-        from backend.app.domains.template.models import Template
-
-        # Create multiple templates with same action
-        for i in range(3):
-            template = Template(name=f"Template {i}")
-            await template_repository.create(template)
-
-            log = AuditLog(
-                entity_type="template", entity_id=template.id, action="created", metadata_={}
-            )
-            await audit_repository.create(log)
+        # Create logs for several entities with the same action
+        await audit_repository.create_batch(
+            [
+                AuditLog(
+                    entity_type="template", entity_id=uid_factory(), action="created", metadata_={}
+                )
+                for _ in range(3)
+            ]
+        )
 
         logs = await audit_repository.query(action="created")
 
         assert len(logs) == 3
 
     @pytest.mark.asyncio
-    async def test_audit_logs_ordered_by_timestamp(self, audit_repository, template_repository):
+    async def test_audit_logs_ordered_by_timestamp(self, audit_repository, seed_template):
         """Should return audit logs in chronological order (newest first)."""
-        import asyncio
-
-        from backend.app.domains.audit.models import AuditLog
-        from backend.app.domains.template.models import Template
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        # Create logs with slight delay
+        # Create logs with explicit, increasing timestamps
+        base_time = utc_now()
         for i in range(3):
             log = AuditLog(
                 entity_type="template",
-                entity_id=template.id,
+                entity_id=seed_template.id,
                 action=f"action_{i}",
                 metadata_={"order": i},
+                timestamp=base_time + timedelta(seconds=i),
             )
             await audit_repository.create(log)
-            await asyncio.sleep(0.01)  # Small delay for timestamp ordering
 
-        logs = await audit_repository.query(entity_type="template", entity_id=template.id)
+        logs = await audit_repository.query(entity_type="template", entity_id=seed_template.id)
 
         # Should be newest first
         assert logs[0].action == "action_2"
         assert logs[2].action == "action_0"
 
     @pytest.mark.asyncio
-    async def test_audit_log_metadata_json(self, audit_repository, template_repository):
+    async def test_audit_log_metadata_json(self, audit_repository, seed_template):
         """Should store complex JSON in metadata field."""
-        from backend.app.domains.audit.models import AuditLog
-        from backend.app.domains.template.models import Template
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
         complex_metadata = {
             "old_value": {"name": "Old Name"},
             "new_value": {"name": "New Name"},
@@ -121,36 +103,114 @@ class TestAuditRepository:
 
         log = AuditLog(
             entity_type="template",
-            entity_id=template.id,
+            entity_id=seed_template.id,
             action="updated",
             metadata_=complex_metadata,
         )
         await audit_repository.create(log)
 
-        logs = await audit_repository.query(entity_type="template", entity_id=template.id)
+        logs = await audit_repository.query(entity_type="template", entity_id=seed_template.id)
 
         assert logs[0].metadata_ == complex_metadata
 
     @pytest.mark.asyncio
-    async def test_query_with_pagination(self, audit_repository, template_repository):
-        """Should support pagination in queries."""
-        from backend.app.domains.audit.models import AuditLog
-        from backend.app.domains.template.models import Template
+    async def test_audit_log_metadata_large_roundtrip(self, audit_repository, seed_template):
+        """Should round-trip a large, nested metadata payload unchanged."""
+        large_metadata = {
+            "changed_fields": [f"field_{i}" for i in range(200)],
+            "new_value": {f"field_{i}": {"text": "é" * 20, "index": i} for i in range(200)},
+            "ratio": 0.1,
+            "reviewed": None,
+        }
+
+        log = AuditLog(
+            entity_type="template",
+            entity_id=seed_template.id,
+            action="updated",
+            metadata_=large_metadata,
+        )
+        await audit_repository.create(log)
 
-        # Create multiple templates and logs
-        for i in range(5):
-            template = Template(name=f"Template {i}")
-            await template_repository.create(template)
+        logs = await audit_repository.query(entity_type="template", entity_id=seed_template.id)
 
-            log = AuditLog(
-                entity_type="template", entity_id=template.id, action="created", metadata_={}
-            )
-            await audit_repository.create(log)
+        assert len(json.dumps(large_metadata)) > 10_000
+        assert logs[0].metadata_ == large_metadata
+
+    @pytest.mark.asyncio
+    async def test_audit_log_metadata_integer_beyond_64_bits_roundtrip(
+        self, audit_repository, uid_factory
+    ):
+        """Should round-trip integers wider than 64 bits without losing precision."""
+        entity_id = uid_factory()
+        metadata = {"big": 2**70, "negative": -(2**65), "ratio": 0.1}
+
+        log = AuditLog(
+            entity_type="template",
+            entity_id=entity_id,
+            action="updated",
+            metadata_=metadata,
+        )
+        await audit_repository.create(log)
+
+        logs = await audit_repository.query(entity_type="template", entity_id=entity_id)
+
+        assert logs[0].metadata_ == metadata
+        assert isinstance(logs[0].metadata_["big"], int)
+
+    @pytest.mark.asyncio
+    async def test_query_with_pagination(self, audit_repository, uid_factory):
+        """Should support pagination in queries."""
+        # Create logs for several entities
+        await audit_repository.create_batch(
+            [
+                AuditLog(
+                    entity_type="template", entity_id=uid_factory(), action="created", metadata_={}
+                )
+                for _ in range(5)
+            ]
+        )
 
         # Test pagination
         paginated = await audit_repository.query(skip=2, limit=2)
         assert len(paginated) == 2
 
+    @pytest.mark.asyncio
+    async def test_query_with_keyset_pagination(self, audit_repository, seed_template):
+        """Should page with an (timestamp, id) cursor instead of an offset."""
+        base_time = utc_now()
+        await audit_repository.create_batch(
+            [
+                AuditLog(
+                    entity_type="template",
+                    entity_id=seed_template.id,
+                    action=f"action_{i}",
+                    metadata_={},
+                    timestamp=base_time + timedelta(seconds=i),
+                )
+                for i in range(5)
+            ]
+        )
+
+        first_page = await audit_repository.query(entity_id=seed_template.id, limit=2)
+        cursor = (first_page[-1].timestamp, first_page[-1].id)
+        second_page = await audit_repository.query(
+            entity_id=seed_template.id, limit=2, after=cursor
+        )
+
+        assert [log.action for log in first_page] == ["action_4", "action_3"]
+        assert [log.action for log in second_page] == ["action_2", "action_1"]
+
+    @pytest.mark.asyncio
+    async def test_query_by_entity_uses_index(self, db_session, audit_repository, uid_factory):
+        """Entity lookups should seek the entity index and read it already ordered."""
+        statement = audit_repository._query_statement(
+            entity_type="template", entity_id=uid_factory()
+        )
+
+        plan = await query_plan(db_session, statement)
+
+        assert uses_index_without_sort(plan, "ix_audit_logs_entity")
+
     @pytest.mark.asyncio
     async def test_query_empty_returns_empty_list(self, audit_repository):
         """Should return empty list when no matching audit logs."""
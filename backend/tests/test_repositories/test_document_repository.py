@@ -11,52 +11,28 @@ from uuid import uuid4
 
 import pytest
 
+from backend.app.domains.document.models import Document, DocumentVersion
+from tests.helpers.query_plan import query_plan, uses_index_without_sort
+
 
 class TestDocumentRepository:
     """Tests for DocumentRepository."""
 
     @pytest.mark.asyncio
-    async def test_create_document(self, document_repository, template_repository):
+    async def test_create_document(self, document_repository, seed_template_version):
         """Should create a document linked to a template version."""
-        from backend.app.domains.document.models import Document
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        # Create template and version first
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
-
         # Create document
-        document = Document(template_version_id=version.id)
+        document = Document(template_version_id=seed_template_version.id)
         created = await document_repository.create(document)
 
         assert created.id is not None
-        assert created.template_version_id == version.id
+        assert created.template_version_id == seed_template_version.id
         assert created.created_at is not None
 
     @pytest.mark.asyncio
-    async def test_get_document_by_id(self, document_repository, template_repository):
+    async def test_get_document_by_id(self, document_repository, seed_template_version):
         """Should retrieve document by ID."""
-        from backend.app.domains.document.models import Document
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
-
-        document = Document(template_version_id=version.id)
+        document = Document(template_version_id=seed_template_version.id)
         created = await document_repository.create(document)
 
         retrieved = await document_repository.get_by_id(created.id)
@@ -75,22 +51,9 @@ class TestDocumentVersionRepository:
     """Tests for document version operations."""
 
     @pytest.mark.asyncio
-    async def test_create_document_version(self, document_repository, template_repository):
+    async def test_create_document_version(self, document_repository, seed_template_version):
         """Should create a document version."""
-        from backend.app.domains.document.models import Document, DocumentVersion
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        template_version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(template_version)
-
-        document = Document(template_version_id=template_version.id)
+        document = Document(template_version_id=seed_template_version.id)
         await document_repository.create(document)
 
         doc_version = DocumentVersion(
@@ -106,22 +69,9 @@ class TestDocumentVersionRepository:
         assert created.version_number == 1
 
     @pytest.mark.asyncio
-    async def test_get_document_version(self, document_repository, template_repository):
+    async def test_get_document_version(self, document_repository, seed_template_version):
         """Should retrieve version by document_id and version_number."""
-        from backend.app.domains.document.models import Document, DocumentVersion
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        template_version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(template_version)
-
-        document = Document(template_version_id=template_version.id)
+        document = Document(template_version_id=seed_template_version.id)
         await document_repository.create(document)
 
         doc_version = DocumentVersion(
@@ -138,33 +88,23 @@ class TestDocumentVersionRepository:
         assert retrieved.version_number == 1
 
     @pytest.mark.asyncio
-    async def test_list_document_versions(self, document_repository, template_repository):
+    async def test_list_document_versions(self, document_repository, seed_template_version):
         """Should list all versions for a document."""
-        from backend.app.domains.document.models import Document, DocumentVersion
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        template_version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(template_version)
-
-        document = Document(template_version_id=template_version.id)
+        document = Document(template_version_id=seed_template_version.id)
         await document_repository.create(document)
 
         # Create multiple versions
-        for i in range(1, 4):
-            doc_version = DocumentVersion(
-                document_id=document.id,
-                version_number=i,
-                output_doc_path=f"documents/test/{i}/output.docx",
-                generation_metadata={"version": i},
-            )
-            await document_repository.create_version(doc_version)
+        await document_repository.create_version_batch(
+            [
+                DocumentVersion(
+                    document_id=document.id,
+                    version_number=i,
+                    output_doc_path=f"documents/test/{i}/output.docx",
+                    generation_metadata={"version": i},
+                )
+                for i in range(1, 4)
+            ]
+        )
 
         versions = await document_repository.list_versions(document.id)
 
@@ -173,32 +113,34 @@ class TestDocumentVersionRepository:
         assert versions[0].version_number == 3
 
     @pytest.mark.asyncio
-    async def test_get_latest_document_version(self, document_repository, template_repository):
-        """Should retrieve the latest document version."""
-        from backend.app.domains.document.models import Document, DocumentVersion
-        from backend.app.domains.template.models import Template, TemplateVersion
+    async def test_list_versions_walks_unique_index(
+        self, db_session, document_repository, uid_factory
+    ):
+        """Newest-first listing should be served by the (document_id, version_number) index."""
+        statement = document_repository._list_versions_statement(uid_factory())
 
-        template = Template(name="Test Template")
-        await template_repository.create(template)
+        plan = await query_plan(db_session, statement)
 
-        template_version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(template_version)
+        # SQLite backs uq_document_version with an automatically named index
+        assert uses_index_without_sort(plan, "sqlite_autoindex_document_versions")
 
-        document = Document(template_version_id=template_version.id)
+    @pytest.mark.asyncio
+    async def test_get_latest_document_version(self, document_repository, seed_template_version):
+        """Should retrieve the latest document version."""
+        document = Document(template_version_id=seed_template_version.id)
         await document_repository.create(document)
 
-        for i in range(1, 4):
-            doc_version = DocumentVersion(
-                document_id=document.id,
-                version_number=i,
-                output_doc_path=f"documents/test/{i}/output.docx",
-                generation_metadata={"version": i},
-            )
-            await document_repository.create_version(doc_version)
+        await document_repository.create_version_batch(
+            [
+                DocumentVersion(
+                    document_id=document.id,
+                    version_number=i,
+                    output_doc_path=f"documents/test/{i}/output.docx",
+                    generation_metadata={"version": i},
+                )
+                for i in range(1, 4)
+            ]
+        )
 
         latest = await document_repository.get_latest_version(document.id)
 
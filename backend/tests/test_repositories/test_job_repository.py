@@ -11,28 +11,22 @@ Verifies:
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
+
+from backend.app.domains.job.models import InvalidJobTransitionError, Job, JobStatus, JobType
+from backend.app.domains.job.repository import _payload_text
+from tests.helpers.query_plan import query_plan, uses_index_without_sort
 
 
 class TestJobRepository:
     """Tests for JobRepository."""
 
     @pytest.mark.asyncio
-    async def test_create_job(self, job_repository, template_repository):
+    async def test_create_job(self, job_repository, seed_template_version):
         """Should create a job."""
-        from backend.app.domains.job.models import Job, JobStatus, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
+        job = Job(
+            job_type=JobType.PARSE, payload={"template_version_id": str(seed_template_version.id)}
         )
-        await template_repository.create_version(version)
-
-        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
         created = await job_repository.create(job)
 
         assert created.id is not None
@@ -41,22 +35,11 @@ class TestJobRepository:
         assert created.created_at is not None
 
     @pytest.mark.asyncio
-    async def test_get_job_by_id(self, job_repository, template_repository):
+    async def test_get_job_by_id(self, job_repository, seed_template_version):
         """Should retrieve job by ID."""
-        from backend.app.domains.job.models import Job, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
+        job = Job(
+            job_type=JobType.PARSE, payload={"template_version_id": str(seed_template_version.id)}
         )
-        await template_repository.create_version(version)
-
-        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
         created = await job_repository.create(job)
 
         retrieved = await job_repository.get_by_id(created.id)
@@ -64,6 +47,20 @@ class TestJobRepository:
         assert retrieved is not None
         assert retrieved.id == created.id
 
+    @pytest.mark.asyncio
+    async def test_create_job_batch(self, job_repository, seed_template_version):
+        """Should create several jobs in one flush."""
+        jobs = [
+            Job(job_type=job_type, payload={"template_version_id": str(seed_template_version.id)})
+            for job_type in [JobType.PARSE, JobType.CLASSIFY]
+        ]
+        created = await job_repository.create_batch(jobs)
+
+        assert [job.job_type for job in created] == [JobType.PARSE, JobType.CLASSIFY]
+        assert all(job.status == JobStatus.PENDING for job in created)
+        for job in created:
+            assert await job_repository.get_by_id(job.id) is job
+
     @pytest.mark.asyncio
     async def test_get_job_by_id_not_found(self, job_repository):
         """Should return None for non-existent job."""
@@ -71,84 +68,97 @@ class TestJobRepository:
         assert result is None
 
     @pytest.mark.asyncio
-    @pytest.mark.skip(
-        reason="list_by_entity uses PostgreSQL JSONB astext which is not supported in SQLite"
-    )
-    async def test_list_jobs_by_entity(self, job_repository, template_repository):
-        """Should list jobs for a specific entity.
-
-        Note: This test is skipped because list_by_entity uses PostgreSQL-specific
-        JSONB operations (payload[key].astext) that aren't compatible with SQLite.
-        This functionality is tested in integration tests with PostgreSQL.
-        """
-        from backend.app.domains.job.models import Job, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
+    async def test_list_jobs_by_entity(self, job_repository, seed_template_version, uid_factory):
+        """Should list only the jobs whose payload references the entity."""
+        payload = {"template_version_id": str(seed_template_version.id)}
+        await job_repository.create_batch(
+            [Job(job_type=JobType.PARSE, payload=payload) for _ in range(3)]
+            + [Job(job_type=JobType.PARSE, payload={"template_version_id": str(uid_factory())})]
         )
-        await template_repository.create_version(version)
-
-        # Create multiple jobs for same entity
-        for _ in range(3):
-            job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
-            await job_repository.create(job)
 
-        jobs = await job_repository.list_by_entity("template_version", version.id)
+        jobs = await job_repository.list_by_entity("template_version", seed_template_version.id)
 
         assert len(jobs) == 3
 
     @pytest.mark.asyncio
-    async def test_list_jobs_by_status(self, job_repository, template_repository):
-        """Should list jobs by status."""
-        from backend.app.domains.job.models import Job, JobStatus, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
+    async def test_get_pipeline_jobs(self, job_repository, seed_template_version, uid_factory):
+        """Should pick each stage's job for the template version and ignore others."""
+        payload = {"template_version_id": str(seed_template_version.id)}
+        parse_job, classify_job, _ = await job_repository.create_batch(
+            [
+                Job(job_type=JobType.PARSE, payload=payload),
+                Job(job_type=JobType.CLASSIFY, payload=payload),
+                Job(job_type=JobType.GENERATE, payload={"template_version_id": str(uid_factory())}),
+            ]
+        )
 
-        template = Template(name="Test Template")
-        await template_repository.create(template)
+        pipeline = await job_repository.get_pipeline_jobs(seed_template_version.id)
 
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
+        assert pipeline == {
+            JobType.PARSE: parse_job,
+            JobType.CLASSIFY: classify_job,
+            JobType.GENERATE: None,
+        }
+
+    def test_payload_lookup_compiles_to_plain_arrow_operator(self):
+        """Payload key lookups should render bare ->> on PostgreSQL, with no CAST."""
+        sql = str(_payload_text("template_version_id").compile(dialect=postgresql.dialect()))
 
+        assert sql == "jobs.payload ->> %(payload_1)s"
+
+    @pytest.mark.asyncio
+    async def test_list_jobs_by_status(self, job_repository, seed_template_version):
+        """Should list jobs by status."""
         # Create jobs
-        for _ in range(3):
-            job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
-            await job_repository.create(job)
+        payload = {"template_version_id": str(seed_template_version.id)}
+        await job_repository.create_batch(
+            [Job(job_type=JobType.PARSE, payload=payload) for _ in range(3)]
+        )
 
         pending_jobs = await job_repository.list_all(status_filter=JobStatus.PENDING)
 
         assert len(pending_jobs) == 3
 
+    @pytest.mark.asyncio
+    async def test_list_jobs_by_status_uses_index(self, db_session, job_repository):
+        """Status listings should walk the (status, created_at) index newest first."""
+        statement = job_repository._list_all_statement(status_filter=JobStatus.PENDING)
+
+        plan = await query_plan(db_session, statement)
+
+        assert uses_index_without_sort(plan, "ix_jobs_status_created")
+
+    @pytest.mark.asyncio
+    async def test_list_jobs_by_status_and_type(self, job_repository, seed_template_version):
+        """Should apply status and type filters together in the query."""
+        payload = {"template_version_id": str(seed_template_version.id)}
+        await job_repository.create_batch(
+            [
+                Job(job_type=JobType.PARSE, payload=payload),
+                Job(job_type=JobType.PARSE, payload=payload, status=JobStatus.COMPLETED),
+                Job(job_type=JobType.CLASSIFY, payload=payload),
+                Job(job_type=JobType.CLASSIFY, payload=payload),
+            ]
+        )
+
+        jobs = await job_repository.list_all(
+            status_filter=JobStatus.PENDING, job_type=JobType.CLASSIFY
+        )
+
+        assert len(jobs) == 2
+        assert all(job.job_type == JobType.CLASSIFY for job in jobs)
+        assert all(job.status == JobStatus.PENDING for job in jobs)
+
 
 class TestJobStatusTransitions:
     """Tests for job status transitions."""
 
     @pytest.mark.asyncio
-    async def test_claim_pending_job(self, job_repository, template_repository):
+    async def test_claim_pending_job(self, job_repository, seed_template_version):
         """Should claim a pending job and mark as RUNNING."""
-        from backend.app.domains.job.models import Job, JobStatus, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
+        job = Job(
+            job_type=JobType.PARSE, payload={"template_version_id": str(seed_template_version.id)}
         )
-        await template_repository.create_version(version)
-
-        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
         await job_repository.create(job)
 
         claimed = await job_repository.claim_pending_job("worker-1")
@@ -159,22 +169,11 @@ class TestJobStatusTransitions:
         assert claimed.started_at is not None
 
     @pytest.mark.asyncio
-    async def test_complete_job(self, job_repository, template_repository):
+    async def test_complete_job(self, job_repository, seed_template_version):
         """Should mark a running job as completed."""
-        from backend.app.domains.job.models import Job, JobStatus, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
+        job = Job(
+            job_type=JobType.PARSE, payload={"template_version_id": str(seed_template_version.id)}
         )
-        await template_repository.create_version(version)
-
-        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
         await job_repository.create(job)
         await job_repository.claim_pending_job("worker-1")
 
@@ -187,22 +186,11 @@ class TestJobStatusTransitions:
         assert completed.completed_at is not None
 
     @pytest.mark.asyncio
-    async def test_fail_job(self, job_repository, template_repository):
+    async def test_fail_job(self, job_repository, seed_template_version):
         """Should mark a job as failed with error."""
-        from backend.app.domains.job.models import Job, JobStatus, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
+        job = Job(
+            job_type=JobType.PARSE, payload={"template_version_id": str(seed_template_version.id)}
         )
-        await template_repository.create_version(version)
-
-        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
         await job_repository.create(job)
         await job_repository.claim_pending_job("worker-1")
 
@@ -217,145 +205,60 @@ class TestJobStatusTransitions:
 class TestJobTypes:
     """Tests for different job types."""
 
-    @pytest.mark.asyncio
-    async def test_create_parse_job(self, job_repository, template_repository):
-        """Should create PARSE job."""
-        from backend.app.domains.job.models import Job, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
-
-        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
-        created = await job_repository.create(job)
-
-        assert created.job_type == JobType.PARSE
-
-    @pytest.mark.asyncio
-    async def test_create_classify_job(self, job_repository, template_repository):
-        """Should create CLASSIFY job."""
-        from backend.app.domains.job.models import Job, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
-
-        job = Job(job_type=JobType.CLASSIFY, payload={"template_version_id": str(version.id)})
-        created = await job_repository.create(job)
-
-        assert created.job_type == JobType.CLASSIFY
-
-    @pytest.mark.asyncio
-    async def test_create_generate_job(
-        self, job_repository, document_repository, template_repository
-    ):
-        """Should create GENERATE job."""
-        from backend.app.domains.document.models import Document
-        from backend.app.domains.job.models import Job, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
-
-        document = Document(template_version_id=version.id)
-        await document_repository.create(document)
-
-        job = Job(job_type=JobType.GENERATE, payload={"document_id": str(document.id)})
+    @pytest.fixture
+    def seed_ids(self, seed_template_version, seed_document):
+        return {
+            "template_version_id": str(seed_template_version.id),
+            "document_id": str(seed_document.id),
+        }
+
+    @pytest.mark.parametrize(
+        "job_type,payload_key",
+        [
+            (JobType.PARSE, "template_version_id"),
+            (JobType.CLASSIFY, "template_version_id"),
+            (JobType.GENERATE, "document_id"),
+        ],
+    )
+    async def test_create_job_of_type(self, job_repository, seed_ids, job_type, payload_key):
+        """Should create a job of each type with its entity payload."""
+        job = Job(job_type=job_type, payload={payload_key: seed_ids[payload_key]})
         created = await job_repository.create(job)
 
-        assert created.job_type == JobType.GENERATE
+        assert created.job_type == job_type
 
 
 class TestJobModelMethods:
     """Tests for Job model transition validation."""
 
     @pytest.mark.asyncio
-    async def test_valid_transition_pending_to_running(self, job_repository, template_repository):
+    async def test_valid_transition_pending_to_running(self, job_repository, seed_template_version):
         """Job model should allow PENDING to RUNNING transition."""
-        from backend.app.domains.job.models import Job, JobStatus, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
+        job = Job(
+            job_type=JobType.PARSE, payload={"template_version_id": str(seed_template_version.id)}
         )
-        await template_repository.create_version(version)
-
-        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
         await job_repository.create(job)
 
         assert job.can_transition_to(JobStatus.RUNNING) is True
 
     @pytest.mark.asyncio
     async def test_invalid_transition_pending_to_completed(
-        self, job_repository, template_repository
+        self, job_repository, seed_template_version
     ):
         """Job model should reject PENDING to COMPLETED transition."""
-        from backend.app.domains.job.models import Job, JobStatus, JobType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
+        job = Job(
+            job_type=JobType.PARSE, payload={"template_version_id": str(seed_template_version.id)}
         )
-        await template_repository.create_version(version)
-
-        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
         await job_repository.create(job)
 
         assert job.can_transition_to(JobStatus.COMPLETED) is False
 
     @pytest.mark.asyncio
-    async def test_transition_raises_on_invalid(self, job_repository, template_repository):
+    async def test_transition_raises_on_invalid(self, job_repository, seed_template_version):
         """Job model transition_to should raise on invalid transition."""
-        from backend.app.domains.job.models import (
-            InvalidJobTransitionError,
-            Job,
-            JobStatus,
-            JobType,
+        job = Job(
+            job_type=JobType.PARSE, payload={"template_version_id": str(seed_template_version.id)}
         )
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
-
-        job = Job(job_type=JobType.PARSE, payload={"template_version_id": str(version.id)})
         await job_repository.create(job)
 
         with pytest.raises(InvalidJobTransitionError):
@@ -8,25 +8,16 @@ Verifies:
 
 import pytest
 
+from backend.app.domains.section.models import Section, SectionType
+
 
 class TestSectionRepository:
     """Tests for SectionRepository."""
 
     @pytest.mark.asyncio
-    async def test_create_sections_batch(self, section_repository, template_repository):
+    async def test_create_sections_batch(self, section_repository, make_template_version):
         """Should create sections in batch."""
-        from backend.app.domains.section.models import Section, SectionType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
+        version = await make_template_version()
 
         sections = [
             Section(
@@ -44,20 +35,11 @@ class TestSectionRepository:
             assert section.id is not None
 
     @pytest.mark.asyncio
-    async def test_get_sections_by_template_version(self, section_repository, template_repository):
+    async def test_get_sections_by_template_version(
+        self, section_repository, make_template_version
+    ):
         """Should list sections for a template version."""
-        from backend.app.domains.section.models import Section, SectionType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
+        version = await make_template_version()
 
         sections = [
             Section(
@@ -78,20 +60,9 @@ class TestSectionTypes:
     """Tests for different section types."""
 
     @pytest.mark.asyncio
-    async def test_create_static_section(self, section_repository, template_repository):
+    async def test_create_static_section(self, section_repository, make_template_version):
         """Should create a STATIC section."""
-        from backend.app.domains.section.models import Section, SectionType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
+        version = await make_template_version()
 
         section = Section(
             template_version_id=version.id,
@@ -104,21 +75,10 @@ class TestSectionTypes:
 
     @pytest.mark.asyncio
     async def test_create_dynamic_section_with_prompt(
-        self, section_repository, template_repository
+        self, section_repository, make_template_version
     ):
         """Should create a DYNAMIC section with prompt config."""
-        from backend.app.domains.section.models import Section, SectionType
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
+        version = await make_template_version()
 
         section = Section(
             template_version_id=version.id,
@@ -13,6 +13,8 @@ from uuid import uuid4
 
 import pytest
 
+from backend.app.domains.template.models import ParsingStatus, Template, TemplateVersion
+
 
 class TestTemplateRepository:
     """Tests for TemplateRepository."""
@@ -20,8 +22,6 @@ class TestTemplateRepository:
     @pytest.mark.asyncio
     async def test_create_template(self, template_repository):
         """Should create a template and return it with ID."""
-        from backend.app.domains.template.models import Template
-
         template = Template(name="Test Template")
         created = await template_repository.create(template)
 
@@ -32,8 +32,6 @@ class TestTemplateRepository:
     @pytest.mark.asyncio
     async def test_get_template_by_id(self, template_repository):
         """Should retrieve template by ID."""
-        from backend.app.domains.template.models import Template
-
         template = Template(name="Test Template")
         created = await template_repository.create(template)
 
@@ -52,8 +50,6 @@ class TestTemplateRepository:
     @pytest.mark.asyncio
     async def test_list_all_templates(self, template_repository):
         """Should list all templates with pagination."""
-        from backend.app.domains.template.models import Template
-
         # Create multiple templates
         for i in range(5):
             template = Template(name=f"Template {i}")
@@ -70,8 +66,6 @@ class TestTemplateRepository:
     @pytest.mark.asyncio
     async def test_delete_template(self, template_repository):
         """Should delete a template."""
-        from backend.app.domains.template.models import Template
-
         template = Template(name="To Delete")
         created = await template_repository.create(template)
 
@@ -87,8 +81,6 @@ class TestTemplateVersionRepository:
     @pytest.mark.asyncio
     async def test_create_template_version(self, template_repository):
         """Should create a template version."""
-        from backend.app.domains.template.models import Template, TemplateVersion
-
         template = Template(name="Test Template")
         await template_repository.create(template)
 
@@ -104,39 +96,35 @@ class TestTemplateVersionRepository:
         assert created.version_number == 1
 
     @pytest.mark.asyncio
-    async def test_get_version(self, template_repository):
-        """Should retrieve version by template_id and version_number."""
-        from backend.app.domains.template.models import Template, TemplateVersion
+    async def test_create_with_versions(self, template_repository):
+        """Should create a template and its versions together."""
+        versions = [
+            TemplateVersion(version_number=i, source_doc_path=f"templates/test/{i}/source.docx")
+            for i in range(1, 3)
+        ]
+        template = await template_repository.create_with_versions(
+            Template(name="Test Template"), versions
+        )
 
-        template = Template(name="Test Template")
-        await template_repository.create(template)
+        assert template.id is not None
+        assert all(version.id is not None for version in versions)
+        assert all(version.template_id == template.id for version in versions)
+        assert await template_repository.get_version(template.id, 2) is not None
 
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
+    @pytest.mark.asyncio
+    async def test_get_version(self, template_repository, make_template_version):
+        """Should retrieve version by template_id and version_number."""
+        version = await make_template_version()
 
-        retrieved = await template_repository.get_version(template.id, 1)
+        retrieved = await template_repository.get_version(version.template_id, 1)
 
         assert retrieved is not None
         assert retrieved.version_number == 1
 
     @pytest.mark.asyncio
-    async def test_get_version_by_id(self, template_repository):
+    async def test_get_version_by_id(self, template_repository, make_template_version):
         """Should retrieve version by its ID."""
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        created = await template_repository.create_version(version)
+        created = await make_template_version()
 
         retrieved = await template_repository.get_version_by_id(created.id)
 
@@ -146,19 +134,13 @@ class TestTemplateVersionRepository:
     @pytest.mark.asyncio
     async def test_get_latest_version(self, template_repository):
         """Should retrieve the latest version number."""
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        # Create multiple versions
-        for i in range(1, 4):
-            version = TemplateVersion(
-                template_id=template.id,
-                version_number=i,
-                source_doc_path=f"templates/test/{i}/source.docx",
-            )
-            await template_repository.create_version(version)
+        template = await template_repository.create_with_versions(
+            Template(name="Test Template"),
+            [
+                TemplateVersion(version_number=i, source_doc_path=f"templates/test/{i}/source.docx")
+                for i in range(1, 4)
+            ],
+        )
 
         latest = await template_repository.get_latest_version(template.id)
 
@@ -168,18 +150,13 @@ class TestTemplateVersionRepository:
     @pytest.mark.asyncio
     async def test_list_versions(self, template_repository):
         """Should list all versions for a template."""
-        from backend.app.domains.template.models import Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        for i in range(1, 4):
-            version = TemplateVersion(
-                template_id=template.id,
-                version_number=i,
-                source_doc_path=f"templates/test/{i}/source.docx",
-            )
-            await template_repository.create_version(version)
+        template = await template_repository.create_with_versions(
+            Template(name="Test Template"),
+            [
+                TemplateVersion(version_number=i, source_doc_path=f"templates/test/{i}/source.docx")
+                for i in range(1, 4)
+            ],
+        )
 
         versions = await template_repository.list_versions(template.id)
 
@@ -194,19 +171,9 @@ class TestParsingStatusUpdates:
     """Tests for parsing status management."""
 
     @pytest.mark.asyncio
-    async def test_mark_parsing_in_progress(self, template_repository):
+    async def test_mark_parsing_in_progress(self, template_repository, make_template_version):
         """Should mark parsing as in progress."""
-        from backend.app.domains.template.models import ParsingStatus, Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
+        version = await make_template_version()
 
         updated = await template_repository.mark_parsing_in_progress(version.id)
 
@@ -214,44 +181,26 @@ class TestParsingStatusUpdates:
         assert updated.parsing_status == ParsingStatus.IN_PROGRESS
 
     @pytest.mark.asyncio
-    async def test_mark_parsing_completed(self, template_repository):
+    async def test_mark_parsing_completed(self, template_repository, make_template_version):
         """Should mark parsing as completed with path and hash."""
-        from backend.app.domains.template.models import ParsingStatus, Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
+        version = await make_template_version()
 
         updated = await template_repository.mark_parsing_completed(
             version.id, parsed_path="templates/test/1/parsed.json", content_hash="abc123hash"
         )
 
         assert updated is not None
-        assert updated.parsing_status == ParsingStatus.COMPLETED
-        assert updated.parsed_representation_path == "templates/test/1/parsed.json"
-        assert updated.content_hash == "abc123hash"
+        assert (
+            updated.parsing_status,
+            updated.parsed_representation_path,
+            updated.content_hash,
+        ) == (ParsingStatus.COMPLETED, "templates/test/1/parsed.json", "abc123hash")
         assert updated.parsed_at is not None
 
     @pytest.mark.asyncio
-    async def test_mark_parsing_failed(self, template_repository):
+    async def test_mark_parsing_failed(self, template_repository, make_template_version):
         """Should mark parsing as failed with error message."""
-        from backend.app.domains.template.models import ParsingStatus, Template, TemplateVersion
-
-        template = Template(name="Test Template")
-        await template_repository.create(template)
-
-        version = TemplateVersion(
-            template_id=template.id,
-            version_number=1,
-            source_doc_path="templates/test/1/source.docx",
-        )
-        await template_repository.create_version(version)
+        version = await make_template_version()
 
         updated = await template_repository.mark_parsing_failed(
             version.id, error="Parse error: Invalid document structure"
@@ -6,7 +6,8 @@ import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.domains.audit.repository import AuditRepository
-from backend.app.domains.document.models import Document
+from backend.app.domains.document.models import Document, DocumentVersion
+from backend.app.domains.document.repository import DocumentRepository
 from backend.app.domains.versioning.repository import VersioningRepository
 from backend.app.domains.versioning.schemas import VersionCreateRequest
 from backend.app.domains.versioning.service import DocumentVersioningService
@@ -71,6 +72,29 @@ async def sample_document(db_session: AsyncSession, template_version_id: UUID) -
     return document
 
 
+@pytest.fixture
+def seed_versions(db_session: AsyncSession, sample_metadata: dict):
+    """Factory inserting a document's existing versions in one flush, bypassing the service.
+
+    For background state only; no storage upload or audit log is written.
+    """
+
+    async def _seed(document: Document, count: int) -> list[DocumentVersion]:
+        versions = [
+            DocumentVersion(
+                document_id=document.id,
+                version_number=number,
+                output_doc_path=f"documents/{document.id}/{number}/output.docx",
+                generation_metadata={**sample_metadata, "version": number},
+            )
+            for number in range(1, count + 1)
+        ]
+        document.current_version = count
+        return await DocumentRepository(db_session).create_version_batch(versions)
+
+    return _seed
+
+
 @pytest_asyncio.fixture
 async def versioning_repository(db_session: AsyncSession) -> VersioningRepository:
     return VersioningRepository(db_session)
@@ -169,21 +169,24 @@ class TestAtomicity:
         sample_document: Document,
         sample_metadata: dict,
         versioning_repository: VersioningRepository,
+        seed_versions,
     ):
-        for i in range(3):
-            content = f"Version {i + 1} content".encode()
+        # Existing history the service has to build on; only the loop below is under test
+        await seed_versions(sample_document, count=2)
+
+        for version_number in range(3, 6):
             request = VersionCreateRequest(
                 document_id=sample_document.id,
-                content=content,
-                generation_metadata={**sample_metadata, "version": i + 1},
+                content=f"Version {version_number} content".encode(),
+                generation_metadata={**sample_metadata, "version": version_number},
             )
 
             result = await versioning_service.create_version(request)
             assert result.success is True
-            assert result.version_number == i + 1
+            assert result.version_number == version_number
 
             document = await versioning_repository.get_document(sample_document.id)
-            assert document.current_version == i + 1
+            assert document.current_version == version_number
 
-            version = await versioning_service.get_version(sample_document.id, i + 1)
+            version = await versioning_service.get_version(sample_document.id, version_number)
             assert version is not None